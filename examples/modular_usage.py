@@ -1,19 +1,59 @@
 """Exemplos de uso da arquitetura modular do MCP Server Firebird."""
 
+import io
+import re
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-# Import individual modules
-from core import I18n, DB_CONFIG, initialize_libraries
-from firebird import FirebirdMCPServer, SQLPatternAnalyzer
-from prompts import DefaultPromptManager, PromptGenerator
-from mcp import MCPServer
+# Chaves de tradução usadas no exemplo de i18n, já separadas por nível
+_I18N_KEYS = (('server_info', 'name'), ('connection', 'successful'))
+
+# Os módulos são importados dentro de cada exemplo, para que rodar um
+# exemplo isolado não carregue os demais subsistemas.
+
+@lru_cache(maxsize=8)
+def _i18n_for(lang: str):
+    """Retorna uma instância I18n por idioma, lendo o arquivo de tradução uma única vez."""
+    from core import I18n
+    return I18n(lang)
+
+class _ThreadOutput(io.TextIOBase):
+    """stdout que direciona a saída de cada thread para o próprio buffer."""
+    
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._target).write(text)
+    
+    def flush(self):
+        self._target.flush()
+    
+    def capture(self, fn):
+        """Executa fn capturando o que ela imprime; retorna (saída, exceção)."""
+        self._local.buffer = io.StringIO()
+        try:
+            fn()
+            error = None
+        except Exception as e:
+            error = e
+        finally:
+            output = self._local.buffer.getvalue()
+            self._local.buffer = None
+        return output, error
 
 def example_sql_analyzer():
     """Exemplo de uso do SQLPatternAnalyzer isoladamente."""
+    from firebird import SQLPatternAnalyzer
+    
     print("=== Exemplo: SQL Pattern Analyzer ===")
     
     analyzer = SQLPatternAnalyzer()
@@ -27,9 +67,8 @@ def example_sql_analyzer():
         "CREATE INDEX idx_users_name ON users (name)"
     ]
     
-    for sql in queries:
+    for sql, analysis in zip(queries, analyzer.analyze_batch(queries)):
         print(f"\nSQL: {sql}")
-        analysis = analyzer.analyze(sql)
         print(f"Type: {analysis['type']}, Complexity: {analysis['complexity']}")
         if analysis['suggestions']:
             print(f"Suggestions: {analysis['suggestions'][:2]}")  # First 2 suggestions
@@ -38,6 +77,8 @@ def example_sql_analyzer():
 
 def example_prompt_generator():
     """Exemplo de uso do PromptGenerator isoladamente."""
+    from prompts import PromptGenerator
+    
     print("\n=== Exemplo: Prompt Generator ===")
     
     generator = PromptGenerator()
@@ -50,8 +91,9 @@ def example_prompt_generator():
     }
     
     prompt = generator.generate('firebird_expert', args)
-    print(f"Prompt gerado ({len(prompt)} chars):")
-    print(prompt[:300] + "..." if len(prompt) > 300 else prompt)
+    n = len(prompt)
+    print(f"Prompt gerado ({n} chars):")
+    print(f"{prompt[:300]}..." if n > 300 else prompt)
 
 def example_i18n_system():
     """Exemplo de uso do sistema de internacionalização."""
@@ -59,18 +101,21 @@ def example_i18n_system():
     
     # Testar diferentes idiomas
     for lang in ['en_US', 'pt_BR', 'es_ES']:  # es_ES não existe, vai usar fallback
-        i18n = I18n(lang)
+        i18n = _i18n_for(lang)
+        server_name, connection_successful = i18n.get_many(_I18N_KEYS)
         print(f"\nIdioma: {lang}")
-        print(f"Server name: {i18n.get('server_info.name')}")
-        print(f"Connection successful: {i18n.get('connection.successful')}")
+        print(f"Server name: {server_name}")
+        print(f"Connection successful: {connection_successful}")
         print(f"Available languages: {i18n.get_available_languages()}")
         
         # Verificar completude
         completeness = i18n.validate_completeness()
-        print(f"Completeness: {completeness['completion_percentage']:.1f}%")
+        print(f"Completeness: {completeness.get('completion_percentage', 100.0):.1f}%")
 
 def example_prompt_manager():
     """Exemplo de uso do DefaultPromptManager."""
+    from prompts import DefaultPromptManager
+    
     print("\n=== Exemplo: Default Prompt Manager ===")
     
     manager = DefaultPromptManager()
@@ -84,12 +129,16 @@ def example_prompt_manager():
     original_content = "Query executed successfully: 42 rows returned"
     enhanced_content = manager.apply_to_response(original_content, tool_name='execute_query')
     
-    print(f"\nOriginal content length: {len(original_content)}")
-    print(f"Enhanced content length: {len(enhanced_content)}")
-    print(f"Enhancement ratio: {len(enhanced_content) / len(original_content):.1f}x")
+    original_length = len(original_content)
+    enhanced_length = len(enhanced_content)
+    print(f"\nOriginal content length: {original_length}")
+    print(f"Enhanced content length: {enhanced_length}")
+    print(f"Enhancement ratio: {enhanced_length / original_length:.1f}x")
 
 def example_firebird_server_mock():
     """Exemplo de uso do FirebirdMCPServer com mock (sem conexão real)."""
+    from firebird import FirebirdMCPServer
+    
     print("\n=== Exemplo: Firebird Server (Mock) ===")
     
     # Criar servidor sem dependências reais
@@ -109,6 +158,11 @@ def example_firebird_server_mock():
 
 def example_full_integration():
     """Exemplo de integração completa dos módulos."""
+    from core import initialize_libraries
+    from firebird import FirebirdMCPServer
+    from prompts import DefaultPromptManager, PromptGenerator
+    from mcp import MCPServer
+    
     print("\n=== Exemplo: Integração Completa ===")
     
     # Inicializar todos os componentes
@@ -124,7 +178,7 @@ def example_full_integration():
     
     prompt_manager = DefaultPromptManager()
     prompt_generator = PromptGenerator(firebird_server)
-    i18n = I18n('en_US')
+    i18n = _i18n_for('en_US')
     
     # Criar servidor MCP
     mcp_server = MCPServer(
@@ -142,42 +196,80 @@ def example_full_integration():
 
 def example_custom_analyzer():
     """Exemplo de extensão do SQLPatternAnalyzer."""
+    from firebird import SQLPatternAnalyzer
+    
     print("\n=== Exemplo: Analyzer Customizado ===")
     
+    class _SqlView:
+        """Query original e sua versão em maiúsculas, calculada uma única vez."""
+        __slots__ = ('raw', 'upper')
+        
+        def __init__(self, sql: str):
+            self.raw = sql
+            self.upper = sql.upper()
+    
     class CustomSQLAnalyzer(SQLPatternAnalyzer):
         """Analyzer personalizado com funcionalidades extras."""
+        __slots__ = ()
+        
+        # Padrões compilados uma única vez, no carregamento da classe.
+        # Aplicados sobre o texto em maiúsculas, dispensando re.I.
+        _RISK_RE = re.compile(
+            r"(?P<select_star>\bSELECT\s+\*)"
+            r"|(?P<string_literal>'[^']*')"
+        )
+        _MODIFY_RE = re.compile(r"\b(?:UPDATE|DELETE)\b")
+        _WHERE_RE = re.compile(r"\bWHERE\b")
+        _RISK_MESSAGES = {
+            'select_star': "Avoid SELECT * for better performance and security",
+            'modify_no_where': "🚨 HIGH RISK: No WHERE clause in modification query",
+            'string_literal': "Consider using parameterized queries to prevent SQL injection"
+        }
+        
+        _TIPS_RE = re.compile(
+            r"(?P<limit>\bLIMIT\b)"
+            r"|(?P<union>\bUNION\b(?!\s+ALL\b))"
+            r"|(?P<in_list>\bIN\s*\()"
+        )
+        _TIPS_MESSAGES = {
+            'limit': "Use FIRST/SKIP instead of LIMIT for better Firebird performance",
+            'union': "Consider UNION ALL if duplicates are acceptable",
+            'in_list': "Consider EXISTS instead of IN for better performance"
+        }
+        
+        @staticmethod
+        def view(sql) -> _SqlView:
+            """Aceita str ou _SqlView; permite compartilhar o upper() entre as análises."""
+            return sql if isinstance(sql, _SqlView) else _SqlView(sql)
+        
+        @staticmethod
+        def _scan_keys(pattern, sql_upper: str) -> set:
+            """Varre a query uma única vez e retorna os grupos nomeados encontrados."""
+            return {match.lastgroup for match in pattern.finditer(sql_upper)}
         
-        def analyze_security_risks(self, sql: str) -> list:
+        @staticmethod
+        def _iter_messages(messages: dict, found: set):
+            """Gera as mensagens das chaves encontradas, na ordem de `messages`."""
+            return (message for key, message in messages.items() if key in found)
+        
+        def _iter_risks(self, view: _SqlView):
+            """Gera as mensagens de risco na ordem de `_RISK_MESSAGES`."""
+            found = self._scan_keys(self._RISK_RE, view.upper)
+            # Riscos que combinam mais de um padrão entram no mesmo conjunto de chaves
+            if self._MODIFY_RE.search(view.upper) and not self._WHERE_RE.search(view.upper):
+                found.add('modify_no_where')
+            if '?' in view.raw:
+                found.discard('string_literal')
+            return self._iter_messages(self._RISK_MESSAGES, found)
+        
+        def analyze_security_risks(self, sql) -> list:
             """Analisa riscos de segurança na query."""
-            risks = []
-            sql_upper = sql.upper()
-            
-            if 'SELECT *' in sql_upper:
-                risks.append("Avoid SELECT * for better performance and security")
-            
-            if 'WHERE' not in sql_upper and any(cmd in sql_upper for cmd in ['UPDATE', 'DELETE']):
-                risks.append("🚨 HIGH RISK: No WHERE clause in modification query")
-            
-            if "'" in sql and '?' not in sql:
-                risks.append("Consider using parameterized queries to prevent SQL injection")
-            
-            return risks
+            return list(self._iter_risks(self.view(sql)))
         
-        def get_firebird_optimization_tips(self, sql: str) -> list:
+        def get_firebird_optimization_tips(self, sql) -> list:
             """Dicas específicas de otimização para Firebird."""
-            tips = []
-            sql_upper = sql.upper()
-            
-            if 'LIMIT' in sql_upper:
-                tips.append("Use FIRST/SKIP instead of LIMIT for better Firebird performance")
-            
-            if 'UNION ' in sql_upper and 'UNION ALL' not in sql_upper:
-                tips.append("Consider UNION ALL if duplicates are acceptable")
-            
-            if 'IN (' in sql_upper:
-                tips.append("Consider EXISTS instead of IN for better performance")
-            
-            return tips
+            view = self.view(sql)
+            return list(self._iter_messages(self._TIPS_MESSAGES, self._scan_keys(self._TIPS_RE, view.upper)))
     
     # Usar o analyzer customizado
     custom_analyzer = CustomSQLAnalyzer()
@@ -188,9 +280,10 @@ def example_custom_analyzer():
     analysis = custom_analyzer.analyze(test_sql)
     print(f"Analysis type: {analysis['type']}")
     
-    # Análises customizadas
-    security_risks = custom_analyzer.analyze_security_risks(test_sql)
-    optimization_tips = custom_analyzer.get_firebird_optimization_tips(test_sql)
+    # Análises customizadas (upper() calculado uma única vez para ambas)
+    view = custom_analyzer.view(test_sql)
+    security_risks = custom_analyzer.analyze_security_risks(view)
+    optimization_tips = custom_analyzer.get_firebird_optimization_tips(view)
     
     print(f"Security risks: {security_risks}")
     print(f"Optimization tips: {optimization_tips}")
@@ -200,13 +293,32 @@ def main():
     print("🔥 Exemplos de Uso - MCP Server Firebird Modular")
     print("=" * 50)
     
+    # Exemplos independentes rodam em paralelo; a saída de cada um é
+    # capturada e impressa na ordem original para não se misturar.
+    independent = (
+        example_sql_analyzer,
+        example_i18n_system,
+        example_prompt_manager,
+        example_prompt_generator,
+        example_firebird_server_mock,
+        example_custom_analyzer
+    )
+    
     try:
-        example_sql_analyzer()
-        example_i18n_system()
-        example_prompt_manager()
-        example_prompt_generator()
-        example_firebird_server_mock()
-        example_custom_analyzer()
+        output = _ThreadOutput(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(output.capture, fn) for fn in independent]
+                results = [future.result() for future in futures]
+        finally:
+            sys.stdout = output._target
+        
+        for text, error in results:
+            sys.stdout.write(text)
+            if error is not None:
+                raise error
+        
         example_full_integration()
         
         print("\n✅ Todos os exemplos executados com sucesso!")
@@ -1,12 +1,35 @@
 #!/usr/bin/env python3
 """
 Script de diagnóstico para problemas com bibliotecas Firebird
+
+Uso: python firebird-diagnostics.py [--deep-test]
+  --deep-test  também tenta uma conexão real via fdb.connect
 """
 
+import ctypes
+import importlib.util
 import os
+import re
+import stat
 import sys
 import subprocess
-import glob
+import shutil
+from collections import deque
+from functools import lru_cache
+
+# Mesmos caminhos consultados pelo servidor (src/core/config.py CLIENT_LIBRARY_PATHS);
+# o script continua independente do pacote para funcionar mesmo com o servidor quebrado
+CLIENT_LIBRARY_PATHS = (
+    "/opt/firebird/lib/libfbclient.so",
+    "/opt/firebird/lib/libfbclient.so.2",
+    "/usr/lib/libfbclient.so.2",
+    "/usr/lib/libfbclient.so",
+    "/usr/lib/x86_64-linux-gnu/libfbclient.so.2",
+    "/usr/lib/x86_64-linux-gnu/libfbclient.so"
+)
+
+# Cache das entradas do ldconfig (preenchido na primeira consulta)
+_LDCONFIG_CACHE = None
 
 def print_header(title):
     print(f"\n{'='*50}")
@@ -35,10 +58,20 @@ def check_environment():
     """Verificar variáveis de ambiente"""
     print_section("Variáveis de Ambiente")
     
-    env_vars = ['FIREBIRD', 'LD_LIBRARY_PATH', 'PATH']
-    for var in env_vars:
-        value = os.environ.get(var, 'NOT SET')
-        print(f"   {var}: {value}")
+    env = os.environ
+    lines = [f"   {var}: {env.get(var, 'NOT SET')}" for var in ('FIREBIRD', 'LD_LIBRARY_PATH', 'PATH')]
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+@lru_cache(maxsize=256)
+def _is_dir(path):
+    """Verificar (com cache) se o caminho é um diretório"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+# Nomes de arquivo que identificam bibliotecas Firebird
+LIBRARY_NAME_RE = re.compile(r'fbclient|firebird|ib_util')
 
 def check_libraries():
     """Procurar bibliotecas Firebird no sistema"""
@@ -54,21 +87,38 @@ def check_libraries():
         '/lib64/'
     ]
     
-    library_patterns = [
-        '*fbclient*',
-        '*firebird*',
-        '*ib_util*'
-    ]
-    
-    found_libraries = []
+    # Bibliotecas registradas no cache do ldconfig (lido uma única vez)
+    found_libraries = list(dict.fromkeys(ldconfig_paths()))
+    known = set(found_libraries)
+    visited = set()
     
     for path in search_paths:
-        if os.path.exists(path):
-            for pattern in library_patterns:
-                files = glob.glob(os.path.join(path, '**', pattern), recursive=True)
-                for file in files:
-                    found_libraries.append(file)
-                    print(f"   ✅ Encontrado: {file}")
+        if not _is_dir(path):
+            continue
+        
+        # Busca em largura: cada diretório é lido uma única vez, mesmo
+        # quando as raízes se sobrepõem (ex.: /usr/lib e /usr/lib/x86_64-linux-gnu)
+        pending = deque([os.path.realpath(path)])
+        while pending:
+            directory = pending.popleft()
+            if directory in visited:
+                continue
+            visited.add(directory)
+            
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif LIBRARY_NAME_RE.search(entry.name) and entry.path not in known:
+                            known.add(entry.path)
+                            found_libraries.append(entry.path)
+            except OSError:
+                continue
+    
+    # Uma única escrita para todos os resultados
+    if found_libraries:
+        sys.stdout.write("".join(f"   ✅ Encontrado: {file}\n" for file in found_libraries))
     
     if not found_libraries:
         print("   ❌ Nenhuma biblioteca Firebird encontrada!")
@@ -76,41 +126,84 @@ def check_libraries():
     
     return True
 
+def ldconfig_entries():
+    """Ler o cache do ldconfig uma única vez e filtrar entradas Firebird"""
+    global _LDCONFIG_CACHE
+    if _LDCONFIG_CACHE is None:
+        ldconfig = shutil.which("ldconfig") or "/sbin/ldconfig"
+        try:
+            result = subprocess.run([ldconfig, "-p"], capture_output=True, text=True, check=False)
+            lines = result.stdout.split('\n')
+        except OSError as e:
+            print(f"   ❌ Error: {e}")
+            lines = []
+        
+        entries = []
+        for line in lines:
+            low = line.lower()
+            if 'firebird' in low or 'fbclient' in low:
+                entries.append(line.strip())
+        _LDCONFIG_CACHE = entries
+    return _LDCONFIG_CACHE
+
+def ldconfig_paths():
+    """Caminhos das bibliotecas Firebird listadas no cache do ldconfig"""
+    return [line.rsplit('=>', 1)[1].strip() for line in ldconfig_entries() if '=>' in line]
+
 def check_ldconfig():
     """Verificar cache de bibliotecas dinâmicas"""
     print_section("Cache de Bibliotecas (ldconfig)")
     
-    run_command("ldconfig -p | grep -i firebird", "Procurar Firebird no cache")
-    run_command("ldconfig -p | grep -i fbclient", "Procurar fbclient no cache")
+    entries = ldconfig_entries()
+    for keyword, description in (('firebird', "Procurar Firebird no cache"),
+                                 ('fbclient', "Procurar fbclient no cache")):
+        matches = [line for line in entries if keyword in line.lower()]
+        if matches:
+            output = "\n".join(matches)
+            print(f"✅ {description}")
+            print(f"   📄 Output: {output}")
+        else:
+            print(f"❌ {description}: nenhuma entrada encontrada")
+
+def find_client_library():
+    """Localizar libfbclient como o servidor faz, sem gravar o cache do servidor"""
+    pinned = os.environ.get('FIREBIRD_CLIENT_LIB')
+    if pinned and os.path.exists(pinned):
+        return pinned
+    
+    import ctypes.util
+    path = ctypes.util.find_library('fbclient')
+    if path:
+        return path
+    return next((p for p in CLIENT_LIBRARY_PATHS if os.path.exists(p)), None)
 
-def test_python_imports():
+def test_python_imports(deep_test=False):
     """Testar imports Python"""
     print_section("Imports Python")
     
-    # Teste FDB
+    # Verificar presença do FDB sem inicializar o módulo
+    if importlib.util.find_spec('fdb') is None:
+        print(f"   ❌ FDB import failed: No module named 'fdb'")
+        return False
+    
+    # Carregar a biblioteca cliente diretamente, sem tentar conexão
+    client_path = find_client_library()
+    if client_path is None:
+        print(f"   ❌ FDB: Bibliotecas cliente não encontradas")
+        return False
+    try:
+        ctypes.CDLL(client_path)
+    except OSError as e:
+        print(f"   ❌ FDB: Falha ao carregar biblioteca cliente {client_path}")
+        print(f"   📄 Erro: {e}")
+        return False
+    print(f"   ✅ Biblioteca cliente carregada: {client_path}")
+    
+    # Import completo apenas quando pacote e biblioteca estão presentes
     try:
         import fdb
         fdb_version = getattr(fdb, '__version__', 'Unknown')
         print(f"   ✅ FDB import OK - Version: {fdb_version}")
-        
-        # Testar criação de conexão (sem conectar)
-        try:
-            # Isso deve falhar na conexão, mas não no import/setup
-            conn = fdb.connect(dsn="localhost/3050:/tmp/nonexistent.fdb", 
-                             user="test", password="test")
-        except Exception as e:
-            error_msg = str(e)
-            if "could not be determined" in error_msg:
-                print(f"   ❌ FDB: Bibliotecas cliente não encontradas")
-                print(f"   📄 Erro: {error_msg}")
-                return False
-            elif "network" in error_msg.lower() or "connection" in error_msg.lower():
-                print(f"   ✅ FDB: Bibliotecas OK (erro de conexão esperado)")
-                return True
-            else:
-                print(f"   ⚠️  FDB: Erro inesperado: {error_msg}")
-                return False
-                
     except ImportError as e:
         print(f"   ❌ FDB import failed: {e}")
         return False
@@ -118,6 +211,27 @@ def test_python_imports():
         print(f"   ❌ FDB error: {e}")
         return False
     
+    if not deep_test:
+        return True
+    
+    # Teste profundo (--deep-test): tentativa real de conexão
+    try:
+        # Isso deve falhar na conexão, mas não no import/setup
+        conn = fdb.connect(dsn="localhost/3050:/tmp/nonexistent.fdb", 
+                         user="test", password="test")
+    except Exception as e:
+        error_msg = str(e)
+        if "could not be determined" in error_msg:
+            print(f"   ❌ FDB: Bibliotecas cliente não encontradas")
+            print(f"   📄 Erro: {error_msg}")
+            return False
+        elif "network" in error_msg.lower() or "connection" in error_msg.lower():
+            print(f"   ✅ FDB: Bibliotecas OK (erro de conexão esperado)")
+            return True
+        else:
+            print(f"   ⚠️  FDB: Erro inesperado: {error_msg}")
+            return False
+    
     return True
 
 def check_system_info():
@@ -127,7 +241,35 @@ def check_system_info():
     run_command("uname -a", "Sistema operacional")
     run_command("python3 --version", "Versão Python")
     run_command("ldd --version", "Versão ldd")
-    run_command("dpkg -l | grep -i firebird", "Pacotes Firebird instalados")
+    check_dpkg_packages()
+
+def check_dpkg_packages():
+    """Listar pacotes Firebird lendo o banco do dpkg diretamente"""
+    try:
+        with open('/var/lib/dpkg/status', 'r', encoding='utf-8', errors='replace', buffering=1 << 16) as f:
+            data = f.read()
+    except OSError:
+        return run_command("dpkg -l | grep -i firebird", "Pacotes Firebird instalados")
+    
+    packages = []
+    for block in data.split('\n\n'):
+        if 'firebird' not in block.lower():
+            continue
+        fields = {}
+        for line in block.splitlines():
+            key, sep, value = line.partition(':')
+            if sep and not line.startswith(' '):
+                fields[key] = value.strip()
+        if fields.get('Status', '').endswith(' installed'):
+            packages.append(f"{fields.get('Package', '?')} {fields.get('Version', '')}".strip())
+    
+    if not packages:
+        print("❌ Pacotes Firebird instalados: nenhum pacote encontrado")
+        return False
+    output = "\n".join(packages)
+    print("✅ Pacotes Firebird instalados")
+    print(f"   📄 Output: {output}")
+    return True
 
 def suggest_fixes():
     """Sugerir correções"""
@@ -169,7 +311,7 @@ def main():
     system_ok = True
     check_system_info()
     
-    python_ok = test_python_imports()
+    python_ok = test_python_imports(deep_test='--deep-test' in sys.argv[1:])
     
     # Resultado final
     print_header("Resultado do Diagnóstico")
@@ -22,14 +22,15 @@ from src import (
     DefaultPromptManager, PromptGenerator,
     MCPServer
 )
+from src.core.config import log, hold_log
 
-def log(message: str):
-    """Log to stderr - visible in Docker/Claude Desktop"""
-    print(f"[MCP-FIREBIRD] {message}", file=sys.stderr, flush=True)
 
 def main():
     """Main function with complete initialization and diagnostics."""
     
+    # Startup diagnostics are written in one go when the server loop starts
+    hold_log()
+    
     # Initialize internationalization
     language = os.getenv('FIREBIRD_LANGUAGE', os.getenv('LANG', 'en_US')).split('.')[0]
     i18n = I18n(language)
@@ -131,7 +132,11 @@ def main():
         i18n=i18n
     )
     
-    mcp_server.run()
+    try:
+        mcp_server.run()
+    finally:
+        # Detach pooled connections (rolling back any open transaction) on shutdown
+        firebird_server.close()
 
 if __name__ == "__main__":
     main()
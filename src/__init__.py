@@ -1,12 +1,12 @@
 """MCP Server Firebird - Modular implementation."""
 
-from .core import I18n, DB_CONFIG, DEFAULT_PROMPT_CONFIG, initialize_libraries
+from .core import I18n, DB_CONFIG, DEFAULT_PROMPT_CONFIG, CACHE_CONFIG, POOL_CONFIG, QUERY_CONFIG, MCP_CONFIG, initialize_libraries
 from .firebird import FirebirdMCPServer, SQLPatternAnalyzer  
 from .prompts import DefaultPromptManager, PromptGenerator
 from .mcp import MCPServer
 
 __all__ = [
-    'I18n', 'DB_CONFIG', 'DEFAULT_PROMPT_CONFIG', 'initialize_libraries',
+    'I18n', 'DB_CONFIG', 'DEFAULT_PROMPT_CONFIG', 'CACHE_CONFIG', 'POOL_CONFIG', 'QUERY_CONFIG', 'MCP_CONFIG', 'initialize_libraries',
     'FirebirdMCPServer', 'SQLPatternAnalyzer',
     'DefaultPromptManager', 'PromptGenerator', 
     'MCPServer'
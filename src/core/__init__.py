@@ -1,6 +1,6 @@
 """Core module for MCP Server Firebird."""
 
 from .i18n import I18n
-from .config import DB_CONFIG, DEFAULT_PROMPT_CONFIG, initialize_libraries
+from .config import DB_CONFIG, DEFAULT_PROMPT_CONFIG, CACHE_CONFIG, POOL_CONFIG, QUERY_CONFIG, MCP_CONFIG, initialize_libraries
 
-__all__ = ['I18n', 'DB_CONFIG', 'DEFAULT_PROMPT_CONFIG', 'initialize_libraries']
+__all__ = ['I18n', 'DB_CONFIG', 'DEFAULT_PROMPT_CONFIG', 'CACHE_CONFIG', 'POOL_CONFIG', 'QUERY_CONFIG', 'MCP_CONFIG', 'initialize_libraries']
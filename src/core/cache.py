@@ -0,0 +1,59 @@
+"""In-process memoization helpers for MCP Server Firebird."""
+
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+
+def make_key(value: Any) -> Hashable:
+    """Build a hashable cache key, canonicalizing dicts/lists/sets recursively."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, make_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(make_key(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(make_key(item) for item in value)
+    return value
+
+
+def memoize_method(maxsize: int = 128, ttl: Optional[float] = None) -> Callable:
+    """
+    Memoize an instance method with a bounded LRU cache stored on the instance.
+
+    Args:
+        maxsize: Maximum number of cached entries per instance
+        ttl: Optional time-to-live in seconds (None keeps entries until evicted)
+
+    The wrapped method exposes ``cache_clear(instance)`` to drop cached entries.
+    """
+    def decorator(func: Callable) -> Callable:
+        attr = f"_memo_{func.__name__}"
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = self.__dict__.get(attr)
+            if cache is None:
+                cache = self.__dict__[attr] = OrderedDict()
+
+            key = (make_key(args), make_key(kwargs))
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and (ttl is None or now - entry[0] < ttl):
+                cache.move_to_end(key)
+                return entry[1]
+
+            value = func(self, *args, **kwargs)
+            cache[key] = (now, value)
+            cache.move_to_end(key)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+            return value
+
+        def cache_clear(instance):
+            instance.__dict__.pop(attr, None)
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
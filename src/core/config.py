@@ -1,13 +1,91 @@
 """Configuration module for MCP Server Firebird."""
 
+import atexit
 import os
 import sys
-import ctypes.util
+import threading
+import time
 from typing import Tuple, Optional
 
+# Seconds between background flushes of buffered log lines
+LOG_FLUSH_INTERVAL = 0.1
+# Buffered characters that trigger an immediate flush
+LOG_BUFFER_SIZE = 4096
+# Lowest severity log() writes (MCP_LOG_LEVEL): info (everything), warning (⚠️ and up) or error (❌/CRITICAL)
+LOG_LEVELS = {'info': 0, 'warning': 1, 'error': 2}
+LOG_LEVEL = LOG_LEVELS.get(os.getenv('MCP_LOG_LEVEL', 'info').lower(), 0)
+
+_LOG_LOCK = threading.Lock()
+_LOG_PENDING = []
+_LOG_PENDING_SIZE = 0
+_LOG_READY = threading.Event()
+_LOG_FLUSHER = None
+_LOG_HELD = False
+
+def flush_log():
+    """Write buffered log lines to stderr in a single call."""
+    global _LOG_PENDING_SIZE
+    with _LOG_LOCK:
+        if not _LOG_PENDING:
+            return
+        data = ''.join(_LOG_PENDING)
+        _LOG_PENDING.clear()
+        _LOG_PENDING_SIZE = 0
+        try:
+            sys.stderr.write(data)
+            sys.stderr.flush()
+        except (OSError, ValueError):
+            pass
+
+def hold_log(held: bool = True):
+    """
+    Pause (or resume) the timed background flush.
+    
+    Startup holds it so every diagnostic line up to the server loop goes
+    out in one write; errors and a full buffer still flush immediately.
+    """
+    global _LOG_HELD
+    _LOG_HELD = held
+    if not held:
+        _LOG_READY.set()
+
+def _log_flush_loop():
+    # Sleeps until something is logged, so an idle server never wakes up
+    while True:
+        _LOG_READY.wait()
+        time.sleep(LOG_FLUSH_INTERVAL)
+        _LOG_READY.clear()
+        if not _LOG_HELD:
+            flush_log()
+
 def log(message: str):
-    """Log to stderr - visible in Docker/Claude Desktop"""
-    print(f"[MCP-FIREBIRD] {message}", file=sys.stderr, flush=True)
+    """
+    Log to stderr - visible in Docker/Claude Desktop.
+    
+    Lines are buffered and flushed LOG_FLUSH_INTERVAL seconds after the
+    first one, once LOG_BUFFER_SIZE characters are pending, and at exit, so
+    a burst of messages costs one write; errors (❌ or CRITICAL) are
+    flushed immediately. Lines below MCP_LOG_LEVEL are dropped before
+    they are buffered.
+    """
+    global _LOG_FLUSHER, _LOG_PENDING_SIZE
+    stripped = message.lstrip()
+    is_error = stripped.startswith(('❌', 'CRITICAL'))
+    if LOG_LEVEL and not is_error and (LOG_LEVEL > 1 or not stripped.startswith('⚠️')):
+        return
+    line = f"[MCP-FIREBIRD] {message}\n"
+    with _LOG_LOCK:
+        _LOG_PENDING.append(line)
+        _LOG_PENDING_SIZE += len(line)
+        full = _LOG_PENDING_SIZE >= LOG_BUFFER_SIZE
+        if _LOG_FLUSHER is None:
+            _LOG_FLUSHER = threading.Thread(target=_log_flush_loop, name="log-flush", daemon=True)
+            _LOG_FLUSHER.start()
+            atexit.register(flush_log)
+    if full or is_error:
+        flush_log()
+    else:
+        _LOG_READY.set()
 
 # Database Configuration
 DB_CONFIG = {
@@ -29,6 +107,151 @@ DEFAULT_PROMPT_CONFIG = {
     'compact_mode': True  # Optimized token usage
 }
 
+# Connection pool configuration
+POOL_CONFIG = {
+    'min_size': int(os.getenv('FIREBIRD_POOL_MIN_SIZE', 1)),
+    'max_size': int(os.getenv('FIREBIRD_POOL_MAX_SIZE', 5)),
+    'timeout': float(os.getenv('FIREBIRD_POOL_TIMEOUT', 30)),
+    # Seconds between pings of idle connections (0 disables the keep-alive thread)
+    'keepalive': float(os.getenv('FIREBIRD_KEEPALIVE_SEC', 0))
+}
+
+# Query execution limits
+QUERY_CONFIG = {
+    'max_rows': int(os.getenv('FIREBIRD_MAX_ROWS', 10000)),
+    'fetch_size': int(os.getenv('FIREBIRD_FETCH_SIZE', 1000)),
+    # False returns {"columns": [...], "rows": [[...]]} instead of one dict per row
+    'legacy_dict_format': os.getenv('FIREBIRD_LEGACY_DICT_FORMAT', 'true').lower() == 'true',
+    # Results above this many rows use the columns/rows format anyway (0 disables)
+    'columnar_threshold': int(os.getenv('FIREBIRD_COLUMNAR_THRESHOLD', 1000)),
+    # Seconds server_status waits for its connection probe
+    'status_timeout': float(os.getenv('FIREBIRD_STATUS_TIMEOUT', 10))
+}
+
+# Server identity reported in initialize and server_status
+SERVER_INFO = {
+    "name": os.getenv("MCP_SERVER_NAME", "firebird-expert-server"),
+    "version": os.getenv("MCP_SERVER_VERSION", "1.0.0")
+}
+
+# MCP protocol options
+MCP_CONFIG = {
+    # tools/list advertises names and descriptions only; full schemas come from tools/describe
+    'lazy_tool_schemas': os.getenv('MCP_LAZY_TOOL_SCHEMAS', 'false').lower() == 'true',
+    # Indent the JSON embedded in tool results (compact by default)
+    'pretty_json': os.getenv('MCP_PRETTY_JSON', 'false').lower() == 'true'
+}
+
+# In-process cache configuration (seconds)
+CACHE_CONFIG = {
+    'prompt_ttl': float(os.getenv('FIREBIRD_PROMPT_CACHE_TTL', 60)),
+    'metadata_ttl': float(os.getenv('FIREBIRD_METADATA_TTL', 30)),
+    'status_ttl': float(os.getenv('FIREBIRD_STATUS_TTL', 5))
+}
+
+# Locations checked when ctypes.util.find_library cannot resolve fbclient
+CLIENT_LIBRARY_PATHS = (
+    "/opt/firebird/lib/libfbclient.so",
+    "/opt/firebird/lib/libfbclient.so.2",
+    "/usr/lib/libfbclient.so.2",
+    "/usr/lib/libfbclient.so",
+    "/usr/lib/x86_64-linux-gnu/libfbclient.so.2",
+    "/usr/lib/x86_64-linux-gnu/libfbclient.so"
+)
+
+# Cross-process record of the last successful lookup ('' disables it), kept per user
+CLIENT_LIBRARY_CACHE = os.getenv('FIREBIRD_CLIENT_CACHE', os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'mcp-firebird', 'clientpath'
+))
+
+# Resolved client library (None until first lookup, '' when not found)
+_FBCLIENT_PATH = None
+# How the client library was located: env-pinned, cache, find_library or path-scan
+_FBCLIENT_SOURCE = None
+
+def _library_stamp(path: str) -> Optional[str]:
+    """
+    Return a fingerprint that changes when the resolved library may have.
+    
+    Absolute paths use the file's mtime; sonames returned by find_library
+    use the mtime of the ldconfig cache, which is rewritten on (re)installs.
+    """
+    try:
+        return str(os.stat(path if os.path.isabs(path) else '/etc/ld.so.cache').st_mtime_ns)
+    except OSError:
+        return None
+
+def _read_library_cache() -> Optional[str]:
+    """Return the cached library path if the cache file is ours and still valid."""
+    try:
+        with open(CLIENT_LIBRARY_CACHE, 'r', encoding='utf-8') as f:
+            # Only trust a file we own that nobody else can write (it names a library we load)
+            st = os.fstat(f.fileno())
+            if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                return None
+            path, stamp = f.read().split('\t')
+    except (OSError, ValueError, AttributeError):
+        return None
+    return path if path and stamp == _library_stamp(path) else None
+
+def _write_library_cache(path: str):
+    """Atomically record a successful lookup for the next process start."""
+    stamp = _library_stamp(path)
+    if stamp is None:
+        return
+    # Imported here: only needed on the first start that resolves the library
+    import tempfile
+    directory = os.path.dirname(os.path.abspath(CLIENT_LIBRARY_CACHE))
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # mkstemp creates a fresh 0600 file (O_EXCL), so a planted name or symlink is never followed
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.clientpath-')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(f"{path}\t{stamp}")
+        os.replace(tmp, CLIENT_LIBRARY_CACHE)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+def find_client_library() -> Optional[str]:
+    """
+    Locate the Firebird client library once per process.
+    
+    FIREBIRD_CLIENT_LIB pins a known-good path and skips the lookup entirely.
+    Otherwise a lookup recorded in CLIENT_LIBRARY_CACHE by an earlier start
+    is reused while the library is unchanged; failing that, find_library
+    shells out to ldconfig and the standard paths are scanned. The result
+    cannot change while the server runs, so later calls return it directly.
+    """
+    global _FBCLIENT_PATH, _FBCLIENT_SOURCE
+    if _FBCLIENT_PATH is None:
+        pinned = os.getenv('FIREBIRD_CLIENT_LIB')
+        if pinned and os.path.exists(pinned):
+            path, source = pinned, 'env-pinned'
+        else:
+            if pinned:
+                log(f"⚠️  FIREBIRD_CLIENT_LIB not found: {pinned}")
+            path = CLIENT_LIBRARY_CACHE and _read_library_cache()
+            source = 'cache'
+            if not path:
+                # Imported here: ctypes.util pulls in subprocess/tempfile and is
+                # only needed when neither the pin nor the cache resolved the path
+                import ctypes.util
+                path, source = ctypes.util.find_library('fbclient'), 'find_library'
+                if not path:
+                    path = next((p for p in CLIENT_LIBRARY_PATHS if os.path.exists(p)), '')
+                    source = 'path-scan' if path else None
+                if path and CLIENT_LIBRARY_CACHE:
+                    _write_library_cache(path)
+        _FBCLIENT_PATH, _FBCLIENT_SOURCE = path, source
+    return _FBCLIENT_PATH or None
+
 def initialize_libraries() -> Tuple[bool, Optional[object], str, bool, Optional[str]]:
     """
     Initialize Firebird libraries and return status.
@@ -52,35 +275,15 @@ def initialize_libraries() -> Tuple[bool, Optional[object], str, bool, Optional[
         
         # Check for client libraries
         try:
-            fbclient_path = ctypes.util.find_library('fbclient')
-            if fbclient_path:
+            client_library_path = find_client_library()
+            if client_library_path:
                 firebird_client_available = True
-                client_library_path = fbclient_path
-                log(f"✅ Firebird client library found: {fbclient_path}")
+                log(f"✅ Firebird client library found: {client_library_path} ({_FBCLIENT_SOURCE})")
             else:
-                log(f"⚠️  Firebird client libraries not found in standard paths")
+                log(f"⚠️  Firebird client libraries not found in standard or alternative paths")
                 log(f"🔍 LD_LIBRARY_PATH: {os.getenv('LD_LIBRARY_PATH', 'not set')}")
+                log(f"❌ No Firebird client libraries found")
                 
-                # Search in alternative paths
-                possible_paths = [
-                    "/opt/firebird/lib/libfbclient.so",
-                    "/opt/firebird/lib/libfbclient.so.2",
-                    "/usr/lib/libfbclient.so.2",
-                    "/usr/lib/libfbclient.so",
-                    "/usr/lib/x86_64-linux-gnu/libfbclient.so.2",
-                    "/usr/lib/x86_64-linux-gnu/libfbclient.so"
-                ]
-                
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        firebird_client_available = True
-                        client_library_path = path
-                        log(f"✅ Found Firebird client at alternative path: {path}")
-                        break
-                
-                if not firebird_client_available:
-                    log(f"❌ No Firebird client libraries found")
-                    
         except Exception as e:
             log(f"⚠️  Library path check failed: {e}")
             
@@ -94,7 +297,4 @@ def initialize_libraries() -> Tuple[bool, Optional[object], str, bool, Optional[
 
 def get_server_info() -> dict:
     """Get server information for MCP responses."""
-    return {
-        "name": os.getenv("MCP_SERVER_NAME", "firebird-expert-server"),
-        "version": os.getenv("MCP_SERVER_VERSION", "1.0.0")
-    }
+    return dict(SERVER_INFO)
@@ -3,10 +3,7 @@
 import json
 import os
 import sys
-import logging
-from typing import Dict, List
-
-logger = logging.getLogger(__name__)
+from typing import Dict, Iterable, List, Sequence
 
 def log(message: str):
     """Log to stderr - visible in Docker/Claude Desktop"""
@@ -21,6 +18,14 @@ class I18n:
         self.strings = {}
         self.fallback_strings = {}
         self.missing_keys = set()
+        self.path = None
+        self.fallback_path = None
+        self._completeness_cache = None
+        # (i18n directory mtime, sorted language codes)
+        self._languages_cache = None
+        # Dotted key -> resolved value, valid for the (strings, fallback_strings) it was built from
+        self._resolved = {}
+        self._resolved_from = (None, None)
         self.load_language()
     
     def load_language(self):
@@ -47,9 +52,11 @@ class I18n:
                     
                 if lang == self.language:
                     self.strings = loaded_strings
+                    self.path = lang_file
                     print(f"✅ Loaded primary language: {lang}", file=sys.stderr)
                 else:
                     self.fallback_strings = loaded_strings
+                    self.fallback_path = lang_file
                     print(f"✅ Loaded fallback language: {lang}", file=sys.stderr)
                 return True
             else:
@@ -101,6 +108,7 @@ class I18n:
                 "client_not_available": "Firebird client libraries not available",
                 "method_not_found": "Method not found",
                 "notification_received": "Notification received",
+                "notification_ignored": "Ignoring unsupported notification",
                 "tables_failed": "Failed to retrieve tables"
             },
             "tools": {
@@ -185,16 +193,10 @@ class I18n:
     
     def get(self, key_path: str, *args, **kwargs) -> str:
         """Get localized string by dot-separated key path with intelligent fallback"""
-        value = self._get_from_dict(self.strings, key_path)
-        
-        if value is None and self.fallback_strings:
-            value = self._get_from_dict(self.fallback_strings, key_path)
+        value = self._resolve(key_path)
         
         if value is None:
-            if key_path not in self.missing_keys:
-                print(f"⚠️  Missing translation key: {key_path}", file=sys.stderr)
-                self.missing_keys.add(key_path)
-            return key_path
+            return self._missing(key_path)
         
         try:
             if args or kwargs:
@@ -207,10 +209,53 @@ class I18n:
             print(f"⚠️  Error formatting string '{key_path}': {e}", file=sys.stderr)
             return value
     
+    def _resolve(self, key_path: str):
+        """Look up a dotted key in primary then fallback strings, memoized per loaded dicts"""
+        source = self._resolved_from
+        if source[0] is not self.strings or source[1] is not self.fallback_strings:
+            self._resolved = {}
+            self._resolved_from = (self.strings, self.fallback_strings)
+        
+        try:
+            return self._resolved[key_path]
+        except KeyError:
+            pass
+        
+        value = self._get_from_dict(self.strings, key_path)
+        if value is None and self.fallback_strings:
+            value = self._get_from_dict(self.fallback_strings, key_path)
+        self._resolved[key_path] = value
+        return value
+    
+    def get_path(self, path: Sequence[str]) -> str:
+        """Get localized string by a pre-split key path, e.g. ('server_info', 'name')"""
+        value = self._get_from_path(self.strings, path)
+        
+        if value is None and self.fallback_strings:
+            value = self._get_from_path(self.fallback_strings, path)
+        
+        if value is None:
+            return self._missing('.'.join(path))
+        return value
+    
+    def get_many(self, paths: Iterable[Sequence[str]]) -> List[str]:
+        """Get several localized strings by pre-split key paths"""
+        return [self.get_path(path) for path in paths]
+    
+    def _missing(self, key_path: str) -> str:
+        """Report a missing key once and return the key itself"""
+        if key_path not in self.missing_keys:
+            print(f"⚠️  Missing translation key: {key_path}", file=sys.stderr)
+            self.missing_keys.add(key_path)
+        return key_path
+    
     def _get_from_dict(self, strings_dict: dict, key_path: str):
         """Navigate through nested dictionary using dot notation"""
+        return self._get_from_path(strings_dict, key_path.split('.'))
+    
+    def _get_from_path(self, strings_dict: dict, keys: Sequence[str]):
+        """Navigate through nested dictionary using a sequence of keys"""
         try:
-            keys = key_path.split('.')
             value = strings_dict
             for key in keys:
                 value = value[key]
@@ -219,27 +264,56 @@ class I18n:
             return None
     
     def get_available_languages(self) -> List[str]:
-        """Get list of available language files"""
+        """Get list of available language files (memoized per directory mtime)"""
         try:
             script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
             i18n_dir = os.path.join(script_dir, "i18n")
             
-            if not os.path.exists(i18n_dir):
+            mtime = self._mtime(i18n_dir)
+            if mtime is None:
                 return []
             
+            cached = self._languages_cache
+            if cached is not None and cached[0] == mtime:
+                return list(cached[1])
+            
             languages = []
             for file in os.listdir(i18n_dir):
                 if file.endswith('.json'):
                     lang_code = file[:-5]
                     languages.append(lang_code)
             
-            return sorted(languages)
+            languages.sort()
+            self._languages_cache = (mtime, languages)
+            return list(languages)
         except Exception as e:
             print(f"⚠️  Error getting available languages: {e}", file=sys.stderr)
             return []
     
     def validate_completeness(self) -> Dict:
-        """Validate completeness of current language against fallback"""
+        """Validate completeness of current language against fallback (memoized per file mtime)"""
+        key = (self.language, self._mtime(self.path), self._mtime(self.fallback_path))
+        cached = self._completeness_cache
+        if (cached is not None and cached[0] == key
+                and cached[1] is self.strings and cached[2] is self.fallback_strings):
+            return dict(cached[3])
+        
+        result = self._compute_completeness()
+        self._completeness_cache = (key, self.strings, self.fallback_strings, result)
+        return dict(result)
+    
+    @staticmethod
+    def _mtime(path):
+        """Modification time of a language file, or None when unavailable"""
+        if not path:
+            return None
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+    
+    def _compute_completeness(self) -> Dict:
+        """Compare current language against fallback"""
         if not self.fallback_strings:
             return {"status": "no_fallback", "missing_keys": []}
         
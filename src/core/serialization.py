@@ -0,0 +1,86 @@
+"""JSON serialization helpers for MCP Server Firebird."""
+
+import base64
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+    # Accept int/Decimal/etc. dict keys like the standard library does, and
+    # hand dates/times to _default so they render as str() in both backends
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    orjson = None
+    JSONDecodeError = json.JSONDecodeError
+
+# Compact, unescaped-UTF-8 output so the stdlib fallback matches orjson
+_JSON_OPTIONS = {'separators': (',', ':'), 'ensure_ascii': False}
+_JSON_PRETTY_OPTIONS = {'indent': 2, 'ensure_ascii': False}
+
+
+def _default(obj: Any) -> Any:
+    """Encode values JSON has no type for: binary data as base64, anything else via str()."""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode('ascii')
+    return str(obj)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy obj with NaN/Infinity floats replaced by None, as orjson encodes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_dumps(obj: Any, pretty: bool) -> str:
+    """Serialize with the standard library, matching orjson's output."""
+    options = _JSON_PRETTY_OPTIONS if pretty else _JSON_OPTIONS
+    try:
+        return json.dumps(obj, default=_default, allow_nan=False, **options)
+    except ValueError as e:
+        if 'Out of range float' not in str(e):
+            raise
+        return json.dumps(_finite(obj), default=_default, **options)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize obj to a JSON string.
+    
+    Uses orjson when installed and falls back to the standard library, both
+    with the same output: values neither encoder understands are emitted via
+    str() (e.g. Decimal, dates and times) or base64 (binary BLOB/OCTETS
+    columns), and NaN/Infinity become null. Integers wider than 64 bits,
+    which orjson rejects, go through the standard library. Output is compact
+    unless pretty is set, which indents by two spaces.
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=_default, option=option).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, pretty)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON, skipping the str round-trip with orjson."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, False).encode('utf-8')
+
+
+def loads(data) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,11 +1,97 @@
 """SQL pattern analysis for Firebird queries."""
 
 import re
-from typing import Dict, List
+from typing import ClassVar, Dict, List, Optional, Pattern, Set
+
+
+def leading_keyword(sql: str) -> str:
+    """
+    Return the first SQL keyword, uppercased, skipping whitespace and comments.
+    
+    Only the leading token is inspected, so no copy of the whole statement is made.
+    """
+    i, n = 0, len(sql)
+    while i < n:
+        if sql[i].isspace():
+            i += 1
+        elif sql.startswith('--', i):
+            i = sql.find('\n', i)
+            if i < 0:
+                return ''
+        elif sql.startswith('/*', i):
+            i = sql.find('*/', i + 2)
+            if i < 0:
+                return ''
+            i += 2
+        else:
+            break
+    
+    j = i
+    while j < n and sql[j].isalpha():
+        j += 1
+    return sql[i:j].upper()
+
 
 class SQLPatternAnalyzer:
     """Analyzes SQL patterns for enhanced guidance and optimization suggestions."""
     
+    __slots__ = ('patterns',)
+    
+    # Keyword detectors scanned in a single pass over the uppercased SQL.
+    # Each alternative sits inside a lookahead so overlapping keywords are
+    # all reported, matching plain substring semantics.
+    FEATURE_SOURCES: ClassVar[Dict[str, str]] = {
+        'join': r'JOIN',
+        'union': r'UNION',
+        'subquery': r'SUBQUERY',
+        'with': r'WITH',
+        'window': r'WINDOW',
+        'over': r'OVER\(',
+        'partition': r'PARTITION',
+        'group_by': r'GROUP\s+BY',
+        'having': r'HAVING',
+        'aggregate': r'COUNT|SUM|AVG|MIN|MAX',
+        'case_when': r'CASE\s+WHEN',
+        'values_batch': r'VALUES\s*\([^)]+\)\s*,',
+        'insert_select': r'INSERT\s+INTO.*SELECT',
+        'merge': r'MERGE',
+        'global_temporary': r'GLOBAL TEMPORARY',
+        'returning': r'RETURNING',
+        'where': r'WHERE',
+        'index': r'INDEX',
+        'procedure': r'PROCEDURE',
+        'trigger': r'TRIGGER'
+    }
+    PATTERNS: ClassVar[Optional[Pattern]] = None
+    
+    # Leading keyword -> analysis method (looked up by name so subclasses can override)
+    ANALYZERS: ClassVar[Dict[str, str]] = {
+        'SELECT': '_analyze_select',
+        'WITH': '_analyze_select',
+        'INSERT': '_analyze_insert',
+        'UPDATE': '_analyze_update',
+        'DELETE': '_analyze_delete',
+        'CREATE': '_analyze_ddl',
+        'ALTER': '_analyze_ddl',
+        'DROP': '_analyze_ddl'
+    }
+    
+    SELECT_COMPLEX: ClassVar[frozenset] = frozenset(
+        {'join', 'union', 'subquery', 'with', 'window', 'partition', 'group_by', 'having'}
+    )
+    SELECT_AGGREGATION: ClassVar[frozenset] = frozenset({'aggregate', 'group_by'})
+    INSERT_BATCH: ClassVar[frozenset] = frozenset({'values_batch', 'insert_select'})
+    UPDATE_COMPLEX: ClassVar[frozenset] = frozenset({'join', 'subquery', 'case_when'})
+    
+    @classmethod
+    def precompile_patterns(cls) -> Pattern:
+        """Compile the consolidated feature pattern once per class."""
+        if cls.PATTERNS is None:
+            cls.PATTERNS = re.compile('|'.join(
+                f'(?=(?P<{name}>{source}))' for name, source in cls.FEATURE_SOURCES.items()
+            ))
+        return cls.PATTERNS
+    
     def __init__(self):
         self.patterns = {
             'select_simple': r'^\s*SELECT\s+[\w\*,\s]+\s+FROM\s+\w+(?:\s+WHERE\s+[\w\s=<>\'\"]+)?(?:\s+ORDER\s+BY\s+[\w\s,]+)?\s*;?\s*$',
@@ -20,6 +106,11 @@ class SQLPatternAnalyzer:
             'ddl_alter': r'^\s*ALTER\s+(?:TABLE|VIEW|INDEX|PROCEDURE).*',
             'ddl_drop': r'^\s*DROP\s+(?:TABLE|VIEW|INDEX|PROCEDURE|TRIGGER).*'
         }
+        self.precompile_patterns()
+    
+    def _scan(self, sql_upper: str) -> Set[str]:
+        """Return the names of all features present in the SQL, in one pass."""
+        return {match.lastgroup for match in self.PATTERNS.finditer(sql_upper)}
     
     def analyze(self, sql: str) -> Dict:
         """
@@ -32,6 +123,7 @@ class SQLPatternAnalyzer:
             Dictionary with analysis results including type, complexity, category, and suggestions
         """
         sql_upper = sql.upper().strip()
+        features = self._scan(sql_upper)
         
         analysis = {
             'type': 'unknown',
@@ -42,21 +134,29 @@ class SQLPatternAnalyzer:
             'performance_tips': []
         }
         
-        if sql_upper.startswith('SELECT'):
-            analysis.update(self._analyze_select(sql_upper))
-        elif sql_upper.startswith('INSERT'):
-            analysis.update(self._analyze_insert(sql_upper))
-        elif sql_upper.startswith('UPDATE'):
-            analysis.update(self._analyze_update(sql_upper))
-        elif sql_upper.startswith('DELETE'):
-            analysis.update(self._analyze_delete(sql_upper))
-        elif any(sql_upper.startswith(ddl) for ddl in ['CREATE', 'ALTER', 'DROP']):
-            analysis.update(self._analyze_ddl(sql_upper))
+        method = self.ANALYZERS.get(leading_keyword(sql))
+        if method is not None:
+            analysis.update(getattr(self, method)(sql_upper, features))
         
         return analysis
     
-    def _analyze_select(self, sql: str) -> Dict:
+    def analyze_batch(self, queries: List[str]) -> List[Dict]:
+        """
+        Analyze several SQL statements.
+        
+        Args:
+            queries: SQL query strings to analyze
+            
+        Returns:
+            List of analysis dictionaries, in the same order as the input
+        """
+        return [self.analyze(sql) for sql in queries]
+    
+    def _analyze_select(self, sql: str, features: Optional[Set[str]] = None) -> Dict:
         """Analyze SELECT statements."""
+        if features is None:
+            features = self._scan(sql)
+        
         result = {
             'type': 'select',
             'category': 'query',
@@ -65,7 +165,7 @@ class SQLPatternAnalyzer:
             'performance_tips': []
         }
         
-        if re.search(self.patterns['select_complex'], sql):
+        if features & self.SELECT_COMPLEX:
             result['complexity'] = 'complex'
             result['suggestions'].extend([
                 'Consider using PLAN to verify optimal execution',
@@ -73,12 +173,12 @@ class SQLPatternAnalyzer:
             ])
             result['performance_tips'].append('Use SET PLAN ON to analyze execution plan')
             
-            if 'WITH' in sql:
+            if 'with' in features:
                 result['firebird_features'].append('Common Table Expression (CTE)')
-            if 'WINDOW' in sql or 'OVER(' in sql:
+            if 'window' in features or 'over' in features:
                 result['firebird_features'].append('Window Functions')
                 
-        elif re.search(self.patterns['select_aggregation'], sql):
+        elif features & self.SELECT_AGGREGATION:
             result['complexity'] = 'intermediate'
             result['suggestions'].extend([
                 'Check index usage for GROUP BY columns',
@@ -86,15 +186,18 @@ class SQLPatternAnalyzer:
             ])
             result['performance_tips'].append('Ensure GROUP BY columns are indexed')
         
-        if 'MERGE' in sql:
+        if 'merge' in features:
             result['firebird_features'].append('MERGE statement')
-        if 'GLOBAL TEMPORARY' in sql:
+        if 'global_temporary' in features:
             result['firebird_features'].append('Global Temporary Tables')
             
         return result
     
-    def _analyze_insert(self, sql: str) -> Dict:
+    def _analyze_insert(self, sql: str, features: Optional[Set[str]] = None) -> Dict:
         """Analyze INSERT statements."""
+        if features is None:
+            features = self._scan(sql)
+        
         result = {
             'type': 'insert',
             'category': 'modification',
@@ -103,7 +206,7 @@ class SQLPatternAnalyzer:
             'performance_tips': []
         }
         
-        if re.search(self.patterns['insert_batch'], sql):
+        if features & self.INSERT_BATCH:
             result['complexity'] = 'intermediate'
             result['suggestions'].extend([
                 'Consider transaction size for batch operations',
@@ -114,13 +217,16 @@ class SQLPatternAnalyzer:
                 'Consider disabling triggers temporarily for large batches'
             ])
         
-        if 'RETURNING' in sql:
+        if 'returning' in features:
             result['firebird_features'].append('RETURNING clause')
         
         return result
     
-    def _analyze_update(self, sql: str) -> Dict:
+    def _analyze_update(self, sql: str, features: Optional[Set[str]] = None) -> Dict:
         """Analyze UPDATE statements."""
+        if features is None:
+            features = self._scan(sql)
+        
         result = {
             'type': 'update',
             'category': 'modification',
@@ -129,20 +235,23 @@ class SQLPatternAnalyzer:
             'performance_tips': []
         }
         
-        if re.search(self.patterns['update_complex'], sql):
+        if features & self.UPDATE_COMPLEX:
             result['complexity'] = 'complex'
             result['suggestions'].append('Verify WHERE clause uses indexed columns')
             result['performance_tips'].append('Use selective WHERE conditions to minimize row scans')
         else:
             result['suggestions'].append('Ensure WHERE clause is selective and uses indexes')
         
-        if 'RETURNING' in sql:
+        if 'returning' in features:
             result['firebird_features'].append('RETURNING clause')
         
         return result
     
-    def _analyze_delete(self, sql: str) -> Dict:
+    def _analyze_delete(self, sql: str, features: Optional[Set[str]] = None) -> Dict:
         """Analyze DELETE statements."""
+        if features is None:
+            features = self._scan(sql)
+        
         result = {
             'type': 'delete',
             'category': 'modification',
@@ -157,14 +266,17 @@ class SQLPatternAnalyzer:
             ]
         }
         
-        if 'WHERE' not in sql:
+        if 'where' not in features:
             result['suggestions'].insert(0, '🚨 WARNING: DELETE without WHERE clause affects ALL rows!')
             result['complexity'] = 'dangerous'
         
         return result
     
-    def _analyze_ddl(self, sql: str) -> Dict:
+    def _analyze_ddl(self, sql: str, features: Optional[Set[str]] = None) -> Dict:
         """Analyze DDL statements."""
+        if features is None:
+            features = self._scan(sql)
+        
         result = {
             'category': 'ddl',
             'suggestions': [],
@@ -172,21 +284,22 @@ class SQLPatternAnalyzer:
             'performance_tips': []
         }
         
-        if sql.startswith('CREATE'):
+        verb = leading_keyword(sql)
+        if verb == 'CREATE':
             result['type'] = 'create'
-            if 'INDEX' in sql:
+            if 'index' in features:
                 result['performance_tips'].extend([
                     'Consider partial indexes for selective conditions',
                     'Use expression indexes for computed values'
                 ])
-            if 'PROCEDURE' in sql or 'TRIGGER' in sql:
+            if 'procedure' in features or 'trigger' in features:
                 result['firebird_features'].append('PSQL (Procedural SQL)')
                 
-        elif sql.startswith('ALTER'):
+        elif verb == 'ALTER':
             result['type'] = 'alter'
             result['suggestions'].append('Schema changes may require exclusive access')
             
-        elif sql.startswith('DROP'):
+        elif verb == 'DROP':
             result['type'] = 'drop'
             result['suggestions'].extend([
                 '⚠️  Destructive operation - verify before execution',
@@ -2,30 +2,441 @@
 
 import sys
 import os
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
-from ..core.config import DB_CONFIG
-from .analyzer import SQLPatternAnalyzer
+from ..core.config import DB_CONFIG, POOL_CONFIG, QUERY_CONFIG, CACHE_CONFIG, log
+from .analyzer import SQLPatternAnalyzer, leading_keyword
+
+
+# Connection error keywords, scanned once per failure (see _DIAG_RULES)
+_DIAG_RE = re.compile(
+    r"(?P<client>could not be determined)"
+    r"|(?P<dependency>libtommath|libtomcrypt)"
+    r"|(?P<network>network error|connection refused)"
+    r"|(?P<authentication>login|password|authentication)"
+    r"|(?P<database>database)"
+    r"|(?P<not_found>not found)",
+    re.I
+)
+
+# (required keyword groups, error type, hint formatted with DB_CONFIG), first match wins
+_DIAG_RULES = (
+    (frozenset({'client'}), "client_library_error",
+     "\n\n💡 FIREBIRD CLIENT ISSUE: Client libraries not properly configured"
+     "\n• The container should have Firebird client libraries installed"
+     "\n• Check if /opt/firebird/lib/libfbclient.so exists"
+     "\n• Verify LD_LIBRARY_PATH includes Firebird lib directory"),
+    (frozenset({'dependency'}), "dependency_error",
+     "\n\n💡 DEPENDENCY ISSUE: Missing required Firebird dependencies"
+     "\n• libtommath.so.0 or libtomcrypt.so.0 not found"
+     "\n• This indicates the Firebird installation is incomplete"
+     "\n• The container build may have failed during dependency installation"),
+    (frozenset({'network'}), "network_error",
+     "\n\n💡 NETWORK ISSUE: Cannot reach {host}:{port}"
+     "\n• Check if Firebird server is running and accessible"
+     "\n• Verify firewall rules allow connections"
+     "\n• Confirm host and port are correct"),
+    (frozenset({'authentication'}), "authentication_error",
+     "\n\n💡 AUTHENTICATION ISSUE: Invalid credentials"
+     "\n• Check username: {user}"
+     "\n• Verify password in FIREBIRD_PASSWORD environment variable"
+     "\n• Ensure user exists in Firebird security database"),
+    (frozenset({'database', 'not_found'}), "database_error",
+     "\n\n💡 DATABASE ISSUE: Database file not found"
+     "\n• Check database path: {database}"
+     "\n• Verify database file exists on Firebird server"
+     "\n• Check file permissions on server"),
+)
+
+# Ad-hoc SQL not worth a prepared-statement cache slot: commented variants of
+# the same query would each take an entry, and RAND() queries are one-offs
+_UNCACHEABLE_RE = re.compile(r"--|/\*|\bRAND\s*\(", re.I)
+
+# Statements that change the schema and invalidate cached metadata
+DDL_VERBS = frozenset({'CREATE', 'ALTER', 'DROP', 'RECREATE'})
+
+# Leading keywords of statements that return a result set (WITH starts a CTE query)
+RESULT_VERBS = frozenset({'SELECT', 'WITH'})
+
+@lru_cache(maxsize=128)
+def _row_builder(columns: tuple):
+    """
+    Return a function turning a list of row tuples into a list of dicts.
+    
+    The function is generated once per column list as a single dict-display
+    comprehension ({'ID': r[0], 'NAME': r[1]}), which avoids the zip() and
+    dict() calls per row. Column names are embedded with repr(), so any name
+    the database reports is a safe literal; non-string names fall back to
+    dict(zip()).
+    """
+    if not all(type(name) is str for name in columns):
+        return lambda rows: [dict(zip(columns, row)) for row in rows]
+    fields = ", ".join(f"{name!r}: r[{index}]" for index, name in enumerate(columns))
+    return eval(f"lambda rows: [{{{fields}}} for r in rows]", {"__builtins__": {}})
 
-def log(message: str):
-    """Log to stderr - visible in Docker/Claude Desktop"""
-    print(f"[MCP-FIREBIRD] {message}", file=sys.stderr, flush=True)
 
 class FirebirdMCPServer:
     """Main Firebird MCP Server class handling database operations."""
     
+    # Prepared statements kept per pooled connection (LRU)
+    STATEMENT_CACHE_SIZE = 128
+    
+    # Idle connections returned more recently than this are handed out unprobed
+    VALIDATE_AFTER_IDLE = 5.0
+    
+    # Liveness check for idle pooled connections
+    PING_SQL = "SELECT 1 FROM RDB$DATABASE"
+    
+    # Every health probe in one roundtrip
+    DIAG_SQL = (
+        "SELECT RDB$GET_CONTEXT('SYSTEM', 'ENGINE_VERSION'), CURRENT_USER, CURRENT_TIMESTAMP "
+        "FROM RDB$DATABASE"
+    )
+    
+    TABLES_SQL = """
+        SELECT TRIM(RDB$RELATION_NAME) as TABLE_NAME,
+               RDB$DESCRIPTION as DESCRIPTION
+        FROM RDB$RELATIONS 
+        WHERE RDB$VIEW_BLR IS NULL 
+        AND (RDB$SYSTEM_FLAG IS NULL OR RDB$SYSTEM_FLAG = 0)
+        ORDER BY RDB$RELATION_NAME
+    """
+    
     def __init__(self, fdb_module=None, fdb_available=False, client_available=False, client_path=None):
         self.fdb = fdb_module
         self.fdb_available = fdb_available
         self.client_available = client_available
         self.client_path = client_path
         self.dsn = f"{DB_CONFIG['host']}/{DB_CONFIG['port']}:{DB_CONFIG['database']}"
+        # Every pooled connection is opened with the same arguments
+        self._connect_kwargs = {
+            'dsn': self.dsn,
+            'user': DB_CONFIG['user'],
+            'password': DB_CONFIG['password'],
+            'charset': DB_CONFIG['charset']
+        }
         self.analyzer = SQLPatternAnalyzer()
         
+        # Idle (connection, idle_since) pairs; _pool_size counts idle + checked out
+        self._pool = queue.Queue(maxsize=POOL_CONFIG['max_size'])
+        self._pool_size = 0
+        self._pool_lock = threading.Lock()
+        self._pool_warmed = False
+        self._keepalive_stop = threading.Event()
+        # id(conn) -> (reusable cursor, OrderedDict[sql, PreparedStatement], metadata_version)
+        self._statements = {}
+        # Bumped whenever DDL runs; sessions built under an older version are
+        # dropped on next use, and callers (e.g. prompt caches) can key on it
+        self.metadata_version = 0
+        # (timestamp, result) of the last successful get_tables call
+        self._tables_cache = None
+        # (timestamp, result) of the last test_connection probe
+        self._last_probe = None
+        # Held while a background stale-while-revalidate probe is running
+        self._probe_lock = threading.Lock()
+        # Connection pinned by begin_transaction until commit/rollback
+        self._tx_conn = None
+        
         log(f"🔗 DSN configured: {self.dsn}")
+    
+    def _connect(self):
+        """Open a new connection to the configured database."""
+        return self.fdb.connect(**self._connect_kwargs)
+    
+    def _reserve_slot(self) -> bool:
+        """Reserve room for a new pooled connection if max_size allows it."""
+        with self._pool_lock:
+            if self._pool_size >= POOL_CONFIG['max_size']:
+                return False
+            self._pool_size += 1
+            return True
+    
+    def _release_slot(self):
+        with self._pool_lock:
+            self._pool_size -= 1
+    
+    def _warm_pool(self):
+        """Open min_size connections the first time the pool is used."""
+        self._pool_warmed = True
+        if POOL_CONFIG['keepalive'] > 0:
+            self._keepalive_stop.clear()
+            threading.Thread(target=self._keepalive_loop, name="firebird-keepalive", daemon=True).start()
+        
+        for _ in range(POOL_CONFIG['min_size'] - self._pool_size):
+            if not self._reserve_slot():
+                break
+            try:
+                self._pool.put_nowait((self._connect(), time.monotonic()))
+            except Exception:
+                self._release_slot()
+                raise
+    
+    def _keepalive_loop(self):
+        """Ping idle connections every FIREBIRD_KEEPALIVE_SEC, dropping dead ones."""
+        while not self._keepalive_stop.wait(POOL_CONFIG['keepalive']):
+            for _ in range(self._pool.qsize()):
+                try:
+                    conn, _ = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                if self._is_alive(conn):
+                    self._release(conn)
+                else:
+                    log("♻️ Keep-alive dropped a dead pooled connection")
+                    self._discard(conn)
+    
+    def _is_alive(self, conn) -> bool:
+        """Cheap liveness probe for an idle pooled connection."""
+        try:
+            cursor, statement = self._prepared(conn, self.PING_SQL)
+            cursor.execute(statement)
+            cursor.fetchone()
+            return True
+        except Exception:
+            return False
+    
+    def _discard(self, conn):
+        """Close a connection and free its pool slot."""
+        self._drop_session(conn)
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._release_slot()
+    
+    def _checkout(self):
+        """Take a live idle connection, open a new one, or wait for a free one."""
+        if not self._pool_warmed:
+            self._warm_pool()
+        
+        while True:
+            try:
+                conn, idle_since = self._pool.get_nowait()
+            except queue.Empty:
+                if self._reserve_slot():
+                    try:
+                        return self._connect()
+                    except Exception:
+                        self._release_slot()
+                        raise
+                try:
+                    conn, idle_since = self._pool.get(timeout=POOL_CONFIG['timeout'])
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No Firebird connection available after {POOL_CONFIG['timeout']}s "
+                        f"(pool max_size={POOL_CONFIG['max_size']})"
+                    )
+            
+            if time.monotonic() - idle_since < self.VALIDATE_AFTER_IDLE or self._is_alive(conn):
+                return conn
+            log("♻️ Discarding stale pooled connection")
+            self._discard(conn)
+    
+    def _release(self, conn):
+        """Roll back and return a connection to the pool, dropping it if that fails."""
+        try:
+            conn.rollback()
+            self._pool.put_nowait((conn, time.monotonic()))
+        except Exception:
+            self._discard(conn)
+    
+    @contextmanager
+    def _acquire(self, transactional: bool = False):
+        """
+        Borrow a pooled connection for the duration of a with-block.
+        
+        The connection is rolled back and returned to the pool when the block
+        exits, even on error. A connection whose rollback fails is broken and
+        is closed, so the next caller reconnects transparently.
+        
+        With transactional=True and an explicit transaction open, the pinned
+        transaction connection is yielded instead and left untouched on exit.
+        """
+        if transactional and self._tx_conn is not None:
+            yield self._tx_conn
+            return
+        
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+    
+    def _session(self, conn):
+        """Return the (cursor, statement LRU, version) entry kept for a pooled connection."""
+        entry = self._statements.get(id(conn))
+        if entry is None or entry[2] != self.metadata_version:
+            self._drop_session(conn)
+            entry = self._statements[id(conn)] = (conn.cursor(), OrderedDict(), self.metadata_version)
+        return entry
+    
+    def _drop_session(self, conn):
+        """Close and forget the cursor and prepared statements cached for conn."""
+        entry = self._statements.pop(id(conn), None)
+        if entry is None:
+            return
+        cursor, statements, _ = entry
+        for statement in statements.values():
+            try:
+                statement.close()
+            except Exception:
+                pass
+        try:
+            cursor.close()
+        except Exception:
+            pass
+    
+    def _release_schema_locks(self, conn):
+        """
+        Close cached statements before DDL runs on conn.
+        
+        An open prepared statement holds an existence lock on every table it
+        references, so DROP/ALTER/RECREATE would fail with "object in use".
+        Sessions of conn and of idle pooled connections are closed here;
+        connections checked out by another thread (keep-alive, background
+        probe) drop theirs on next use via metadata_version.
+        """
+        self._invalidate_metadata()
+        self._drop_session(conn)
+        idle = []
+        while True:
+            try:
+                idle.append(self._pool.get_nowait())
+            except queue.Empty:
+                break
+        for item in idle:
+            self._drop_session(item[0])
+            self._pool.put_nowait(item)
+    
+    def _cursor(self, conn):
+        """
+        Return the connection's reusable cursor.
         
-    def test_connection(self) -> Dict[str, Any]:
-        """Test connection to external Firebird with detailed diagnostics."""
+        A pooled connection is only used by the caller that checked it out, so
+        sharing one cursor per connection needs no extra locking.
+        """
+        return self._session(conn)[0]
+    
+    def _prepared(self, conn, sql: str, cache: bool = True):
+        """
+        Return (cursor, prepared statement) for sql on a pooled connection.
+        
+        Statements are prepared once per connection and reused, so repeated
+        queries skip the server-side parse/plan roundtrip. SQL matching
+        _UNCACHEABLE_RE, or passed with cache=False (DDL, one-off DML), is
+        returned as plain text instead.
+        """
+        cursor, statements, _ = self._session(conn)
+        
+        statement = statements.get(sql)
+        if statement is not None:
+            try:
+                statements.move_to_end(sql)
+                return cursor, statement
+            except KeyError:
+                pass  # dropped meanwhile; prepare it again below
+        
+        if not cache or _UNCACHEABLE_RE.search(sql):
+            # cursor.execute() prepares plain SQL text itself, without caching it
+            return cursor, sql
+        
+        statement = statements[sql] = cursor.prep(sql)
+        while len(statements) > self.STATEMENT_CACHE_SIZE:
+            _, evicted = statements.popitem(last=False)
+            try:
+                evicted.close()
+            except Exception:
+                pass
+        return cursor, statement
+    
+    def _fetchall(self, sql: str, params: Optional[List] = None) -> list:
+        """
+        Run a read-only query on a pooled connection and return all rows.
+        
+        If the query fails and the connection no longer answers the liveness
+        probe, the connection was lost mid-call: it is discarded and the read
+        is retried once on a fresh connection instead of surfacing the error.
+        """
+        for attempt in range(2):
+            conn = self._checkout()
+            try:
+                cursor, statement = self._prepared(conn, sql)
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                rows = cursor.fetchall()
+            except Exception:
+                if attempt or self._is_alive(conn):
+                    self._release(conn)
+                    raise
+                log("♻️ Connection lost, retrying on a new connection")
+                self._discard(conn)
+                continue
+            self._release(conn)
+            return rows
+    
+    def _invalidate_metadata(self):
+        """Forget cached metadata after a DDL statement changed the schema."""
+        self._tables_cache = None
+        self.metadata_version += 1
+    
+    def close(self):
+        """Roll back any open transaction and close all idle pooled connections."""
+        if self._tx_conn is not None:
+            self._end_transaction(commit=False)
+        self._keepalive_stop.set()
+        while True:
+            try:
+                conn, _ = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+        self._pool_warmed = False
+        
+    @property
+    def has_probe(self) -> bool:
+        """Whether a connection probe result is cached, so test_connection(stale_ok=True) will not block."""
+        return self._last_probe is not None
+    
+    def test_connection(self, force: bool = False, stale_ok: bool = False) -> Dict[str, Any]:
+        """
+        Test connection to external Firebird with detailed diagnostics.
+        
+        Results are reused for CACHE_CONFIG['status_ttl'] seconds so repeated
+        status polls do not hit the database; pass force=True to re-probe.
+        With stale_ok=True an expired result is returned immediately while a
+        background thread refreshes it (stale-while-revalidate).
+        """
+        cached = self._last_probe
+        if not force and cached is not None:
+            if time.monotonic() - cached[0] < CACHE_CONFIG['status_ttl']:
+                return cached[1]
+            if stale_ok:
+                if self._probe_lock.acquire(blocking=False):
+                    threading.Thread(target=self._refresh_probe, name="status-refresh", daemon=True).start()
+                return cached[1]
+        
+        result = self._probe_connection()
+        self._last_probe = (time.monotonic(), result)
+        return result
+    
+    def _refresh_probe(self):
+        """Re-run the connection probe in the background; _probe_lock is held by the caller."""
+        try:
+            self._last_probe = (time.monotonic(), self._probe_connection())
+        finally:
+            self._probe_lock.release()
+    
+    def _probe_connection(self) -> Dict[str, Any]:
+        """Run the connection diagnostics against the database."""
         if not self.fdb_available:
             return {
                 "connected": False,
@@ -51,16 +462,10 @@ class FirebirdMCPServer:
             
         try:
             log(f"🔌 Attempting connection: {self.dsn}")
-            conn = self.fdb.connect(
-                dsn=self.dsn,
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password'],
-                charset=DB_CONFIG['charset']
-            )
-            cursor = conn.cursor()
-            cursor.execute("SELECT RDB$GET_CONTEXT('SYSTEM', 'ENGINE_VERSION') FROM RDB$DATABASE")
-            version = cursor.fetchone()[0]
-            conn.close()
+            with self._acquire() as conn:
+                cursor, statement = self._prepared(conn, self.DIAG_SQL)
+                cursor.execute(statement)
+                version, current_user, server_time = cursor.fetchone()
             log(f"✅ Connection successful")
             
             return {
@@ -68,7 +473,9 @@ class FirebirdMCPServer:
                 "version": version.strip(),
                 "dsn": self.dsn,
                 "user": DB_CONFIG['user'],
-                "charset": DB_CONFIG['charset']
+                "charset": DB_CONFIG['charset'],
+                "current_user": current_user.strip() if current_user else current_user,
+                "server_time": str(server_time)
             }
             
         except Exception as e:
@@ -76,40 +483,12 @@ class FirebirdMCPServer:
             error_msg = str(e)
             error_type = "unknown_error"
             
-            if "could not be determined" in error_msg.lower():
-                error_type = "client_library_error"
-                error_msg += "\n\n💡 FIREBIRD CLIENT ISSUE: Client libraries not properly configured"
-                error_msg += "\n• The container should have Firebird client libraries installed"
-                error_msg += "\n• Check if /opt/firebird/lib/libfbclient.so exists"
-                error_msg += "\n• Verify LD_LIBRARY_PATH includes Firebird lib directory"
-                
-            elif "libtommath" in error_msg.lower() or "libtomcrypt" in error_msg.lower():
-                error_type = "dependency_error"
-                error_msg += "\n\n💡 DEPENDENCY ISSUE: Missing required Firebird dependencies"
-                error_msg += "\n• libtommath.so.0 or libtomcrypt.so.0 not found"
-                error_msg += "\n• This indicates the Firebird installation is incomplete"
-                error_msg += "\n• The container build may have failed during dependency installation"
-                
-            elif "network error" in error_msg.lower() or "connection refused" in error_msg.lower():
-                error_type = "network_error"
-                error_msg += f"\n\n💡 NETWORK ISSUE: Cannot reach {DB_CONFIG['host']}:{DB_CONFIG['port']}"
-                error_msg += "\n• Check if Firebird server is running and accessible"
-                error_msg += "\n• Verify firewall rules allow connections"
-                error_msg += "\n• Confirm host and port are correct"
-                
-            elif "login" in error_msg.lower() or "password" in error_msg.lower() or "authentication" in error_msg.lower():
-                error_type = "authentication_error"
-                error_msg += "\n\n💡 AUTHENTICATION ISSUE: Invalid credentials"
-                error_msg += f"\n• Check username: {DB_CONFIG['user']}"
-                error_msg += "\n• Verify password in FIREBIRD_PASSWORD environment variable"
-                error_msg += "\n• Ensure user exists in Firebird security database"
-                
-            elif "database" in error_msg.lower() and "not found" in error_msg.lower():
-                error_type = "database_error"
-                error_msg += f"\n\n💡 DATABASE ISSUE: Database file not found"
-                error_msg += f"\n• Check database path: {DB_CONFIG['database']}"
-                error_msg += "\n• Verify database file exists on Firebird server"
-                error_msg += "\n• Check file permissions on server"
+            found = {match.lastgroup for match in _DIAG_RE.finditer(error_msg)}
+            for required, diag_type, hint in _DIAG_RULES:
+                if required <= found:
+                    error_type = diag_type
+                    error_msg += hint.format(**DB_CONFIG)
+                    break
             
             return {
                 "connected": False,
@@ -119,8 +498,16 @@ class FirebirdMCPServer:
                 "config": DB_CONFIG
             }
     
-    def execute_query(self, sql: str, params: Optional[List] = None) -> Dict[str, Any]:
-        """Execute SQL query with robust error handling and analysis."""
+    def execute_query(self, sql: str, params: Optional[List] = None,
+                      result_format: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute SQL query with robust error handling and analysis.
+        
+        result_format selects the SELECT result shape: "row" always returns one
+        object per row under "data", "column" returns one array per column
+        under "data", and None picks per QUERY_CONFIG (objects, or columns +
+        "rows" arrays for large results).
+        """
         if not self.fdb_available:
             return {
                 "success": False,
@@ -138,44 +525,72 @@ class FirebirdMCPServer:
             }
         
         analysis = self.analyzer.analyze(sql)
+        verb = leading_keyword(sql)
             
         try:
-            conn = self.fdb.connect(
-                dsn=self.dsn,
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password'],
-                charset=DB_CONFIG['charset']
-            )
-            cursor = conn.cursor()
-            
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-            
-            if sql.strip().upper().startswith('SELECT'):
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                rows = cursor.fetchall()
-                data = [dict(zip(columns, row)) for row in rows]
-                result = {
-                    "success": True,
-                    "data": data,
-                    "row_count": len(data),
-                    "columns": columns,
-                    "sql": sql,
-                    "analysis": analysis
-                }
-            else:
-                affected = cursor.rowcount
-                conn.commit()
-                result = {
-                    "success": True,
-                    "affected_rows": affected,
-                    "sql": sql,
-                    "analysis": analysis
-                }
+            with self._acquire(transactional=True) as conn:
+                in_transaction = conn is self._tx_conn
+                if verb in DDL_VERBS:
+                    self._release_schema_locks(conn)
+                cursor, statement = self._prepared(conn, sql, cache=verb in RESULT_VERBS)
                 
-            conn.close()
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                
+                if verb in RESULT_VERBS:
+                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                    max_rows = QUERY_CONFIG['max_rows']
+                    cursor.arraysize = QUERY_CONFIG['fetch_size']
+                    
+                    # Rows stay plain tuples; only small results are turned into
+                    # one dict per row, so large ones skip N dict allocations
+                    data = []
+                    while len(data) < max_rows:
+                        chunk = cursor.fetchmany(min(cursor.arraysize, max_rows - len(data)))
+                        if not chunk:
+                            break
+                        data.extend(chunk)
+                    truncated = len(data) >= max_rows and cursor.fetchone() is not None
+                    
+                    row_count = len(data)
+                    threshold = QUERY_CONFIG['columnar_threshold']
+                    if result_format == 'column':
+                        key = "data"
+                        data = [list(values) for values in zip(*data)] if data else [[] for _ in columns]
+                    elif result_format != 'row' and (
+                            not QUERY_CONFIG['legacy_dict_format'] or 0 < threshold < row_count):
+                        key = "rows"
+                    else:
+                        key = "data"
+                        data = _row_builder(tuple(columns))(data)
+                    
+                    result = {
+                        "success": True,
+                        key: data,
+                        "row_count": row_count,
+                        "truncated": truncated,
+                        "columns": columns,
+                        "sql": sql,
+                        "analysis": analysis
+                    }
+                    if result_format == 'column':
+                        result["format"] = "column"
+                else:
+                    affected = cursor.rowcount
+                    if not in_transaction:
+                        conn.commit()
+                    if verb in DDL_VERBS:
+                        self._invalidate_metadata()
+                    result = {
+                        "success": True,
+                        "affected_rows": affected,
+                        "in_transaction": in_transaction,
+                        "sql": sql,
+                        "analysis": analysis
+                    }
+            
             return result
                 
         except Exception as e:
@@ -187,6 +602,116 @@ class FirebirdMCPServer:
                 "analysis": analysis
             }
     
+    def execute_batch(self, sql: str, params_list: List[List]) -> Dict[str, Any]:
+        """
+        Execute one parameterized statement for many parameter sets.
+        
+        The statement is prepared once and every row runs in the same
+        transaction, which is committed only if all executions succeed
+        (or left open when an explicit transaction is active).
+        """
+        if not self.fdb_available:
+            return {
+                "success": False,
+                "error": "FDB library not available",
+                "solution": "FDB Python library not installed in container",
+                "type": "fdb_library_error"
+            }
+            
+        if not self.client_available:
+            return {
+                "success": False,
+                "error": "Firebird client libraries not available",
+                "solution": "Firebird client libraries missing from container",
+                "type": "client_library_error"
+            }
+        
+        analysis = self.analyzer.analyze(sql)
+        row_counts = []
+        
+        try:
+            with self._acquire(transactional=True) as conn:
+                in_transaction = conn is self._tx_conn
+                # Prepared once for this batch only; DML is not kept in the statement cache
+                cursor = self._cursor(conn)
+                statement = cursor.prep(sql)
+                try:
+                    for params in params_list:
+                        cursor.execute(statement, params)
+                        row_counts.append(cursor.rowcount)
+                finally:
+                    statement.close()
+                if not in_transaction:
+                    conn.commit()
+            
+            return {
+                "success": True,
+                "executed": len(row_counts),
+                "affected_rows": sum(count for count in row_counts if count > 0),
+                "row_counts": row_counts,
+                "in_transaction": in_transaction,
+                "sql": sql,
+                "analysis": analysis
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "failed_index": len(row_counts),
+                "sql": sql,
+                "analysis": analysis
+            }
+    
+    def begin_transaction(self) -> Dict[str, Any]:
+        """
+        Start an explicit transaction.
+        
+        A pooled connection is pinned until commit_transaction or
+        rollback_transaction; execute_query and execute_batch run on it
+        without committing, so many statements share one COMMIT.
+        """
+        if not self.fdb_available or not self.client_available:
+            return {"success": False, "error": "Required libraries not available"}
+        
+        if self._tx_conn is not None:
+            return {"success": False, "error": "A transaction is already active"}
+        
+        try:
+            self._tx_conn = self._checkout()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        
+        log("🔒 Transaction started")
+        return {"success": True, "transaction": "started"}
+    
+    def commit_transaction(self) -> Dict[str, Any]:
+        """Commit the explicit transaction and return its connection to the pool."""
+        return self._end_transaction(commit=True)
+    
+    def rollback_transaction(self) -> Dict[str, Any]:
+        """Roll back the explicit transaction and return its connection to the pool."""
+        return self._end_transaction(commit=False)
+    
+    def _end_transaction(self, commit: bool) -> Dict[str, Any]:
+        conn = self._tx_conn
+        if conn is None:
+            return {"success": False, "error": "No active transaction"}
+        
+        self._tx_conn = None
+        action = "committed" if commit else "rolled_back"
+        try:
+            if commit:
+                conn.commit()
+            else:
+                conn.rollback()
+            log(f"🔓 Transaction {action}")
+            return {"success": True, "transaction": action}
+        except Exception as e:
+            return {"success": False, "error": str(e), "transaction": "rolled_back"}
+        finally:
+            self._release(conn)
+    
     def get_tables(self) -> Dict[str, Any]:
         """List database tables with additional metadata."""
         if not self.fdb_available:
@@ -204,42 +729,27 @@ class FirebirdMCPServer:
                 "solution": "Firebird client libraries missing from container",
                 "type": "client_library_error"
             }
+        
+        cached = self._tables_cache
+        if cached is not None and time.monotonic() - cached[0] < CACHE_CONFIG['metadata_ttl']:
+            return cached[1]
             
         try:
-            conn = self.fdb.connect(
-                dsn=self.dsn,
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password'],
-                charset=DB_CONFIG['charset']
-            )
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT TRIM(RDB$RELATION_NAME) as TABLE_NAME,
-                       COALESCE(RDB$DESCRIPTION, 'No description') as DESCRIPTION
-                FROM RDB$RELATIONS 
-                WHERE RDB$VIEW_BLR IS NULL 
-                AND (RDB$SYSTEM_FLAG IS NULL OR RDB$SYSTEM_FLAG = 0)
-                ORDER BY RDB$RELATION_NAME
-            """)
-            tables_data = cursor.fetchall()
+            tables_data = self._fetchall(self.TABLES_SQL)
             
-            tables = []
-            for row in tables_data:
-                tables.append({
-                    "name": row[0],
-                    "description": row[1] if row[1] != "No description" else None
-                })
+            # Rows are (TRIMmed name, description or NULL), ready to use as-is
+            names = [row[0] for row in tables_data]
+            tables = [{"name": name, "description": description} for name, description in tables_data]
             
-            conn.close()
-            
-            return {
+            result = {
                 "success": True,
-                "tables": [t["name"] for t in tables],
+                "tables": names,
                 "tables_detailed": tables,
                 "count": len(tables),
                 "database": DB_CONFIG['database']
             }
+            self._tables_cache = (time.monotonic(), result)
+            return result
             
         except Exception as e:
             log(f"❌ Failed to retrieve tables: {e}")
@@ -258,16 +768,8 @@ class FirebirdMCPServer:
             }
         
         try:
-            conn = self.fdb.connect(
-                dsn=self.dsn,
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password'],
-                charset=DB_CONFIG['charset']
-            )
-            cursor = conn.cursor()
-            
             # Get table columns
-            cursor.execute("""
+            columns = self._fetchall("""
                 SELECT 
                     TRIM(rf.RDB$FIELD_NAME) as COLUMN_NAME,
                     TRIM(f.RDB$FIELD_TYPE) as FIELD_TYPE,
@@ -281,9 +783,6 @@ class FirebirdMCPServer:
                 ORDER BY rf.RDB$FIELD_POSITION
             """, [table_name.upper()])
             
-            columns = cursor.fetchall()
-            conn.close()
-            
             return {
                 "success": True,
                 "table_name": table_name,
@@ -313,108 +812,101 @@ class FirebirdMCPServer:
             return {"success": False, "error": "Required libraries not available"}
         
         try:
-            conn = self.fdb.connect(
-                dsn=self.dsn,
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password'],
-                charset=DB_CONFIG['charset']
-            )
-            cursor = conn.cursor()
-            
-            # Get columns with basic data types (simplified and robust query)
-            cursor.execute("""
-                SELECT 
-                    TRIM(rf.RDB$FIELD_NAME) as column_name,
-                    CASE f.RDB$FIELD_TYPE
-                        WHEN 7 THEN 'SMALLINT'
-                        WHEN 8 THEN 'INTEGER'
-                        WHEN 10 THEN 'FLOAT'
-                        WHEN 12 THEN 'DATE'
-                        WHEN 13 THEN 'TIME'
-                        WHEN 14 THEN 'CHAR'
-                        WHEN 16 THEN 'BIGINT'
-                        WHEN 27 THEN 'DOUBLE PRECISION'
-                        WHEN 35 THEN 'TIMESTAMP'
-                        WHEN 37 THEN 'VARCHAR'
-                        WHEN 261 THEN 'BLOB'
-                        ELSE 'UNKNOWN'
-                    END as base_type,
-                    f.RDB$FIELD_LENGTH as field_length,
-                    f.RDB$FIELD_SCALE as field_scale,
-                    CASE WHEN rf.RDB$NULL_FLAG IS NULL THEN 'YES' ELSE 'NO' END as nullable,
-                    TRIM(rf.RDB$DEFAULT_SOURCE) as default_value,
-                    rf.RDB$FIELD_POSITION as "position"
-                FROM RDB$RELATION_FIELDS rf
-                JOIN RDB$FIELDS f ON rf.RDB$FIELD_SOURCE = f.RDB$FIELD_NAME
-                WHERE rf.RDB$RELATION_NAME = ?
-                ORDER BY rf.RDB$FIELD_POSITION
-            """, [table_name.upper()])
-            
-            columns_raw = cursor.fetchall()
-            
-            # Get primary key with error handling
-            primary_keys = []
-            try:
-                cursor.execute("""
-                    SELECT TRIM(s.RDB$FIELD_NAME) as column_name
-                    FROM RDB$INDEX_SEGMENTS s
-                    JOIN RDB$INDICES i ON s.RDB$INDEX_NAME = i.RDB$INDEX_NAME
-                    JOIN RDB$RELATION_CONSTRAINTS rc ON i.RDB$INDEX_NAME = rc.RDB$INDEX_NAME
-                    WHERE rc.RDB$RELATION_NAME = ?
-                    AND rc.RDB$CONSTRAINT_TYPE = 'PRIMARY KEY'
-                    ORDER BY s.RDB$FIELD_POSITION
-                """, [table_name.upper()])
+            with self._acquire() as conn:
+                cursor = self._cursor(conn)
                 
-                primary_keys = [row[0] for row in cursor.fetchall()]
-            except Exception as e:
-                log(f"⚠️ Warning getting primary keys for {table_name}: {e}")
-            
-            # Get foreign keys with error handling
-            foreign_keys = []
-            try:
+                # Get columns with basic data types (simplified and robust query)
                 cursor.execute("""
                     SELECT 
-                        TRIM(rc.RDB$CONSTRAINT_NAME) as constraint_name,
-                        TRIM(s.RDB$FIELD_NAME) as column_name,
-                        TRIM(rc2.RDB$RELATION_NAME) as referenced_table,
-                        TRIM(s2.RDB$FIELD_NAME) as referenced_column
-                    FROM RDB$RELATION_CONSTRAINTS rc
-                    JOIN RDB$INDICES i ON rc.RDB$INDEX_NAME = i.RDB$INDEX_NAME
-                    JOIN RDB$INDEX_SEGMENTS s ON i.RDB$INDEX_NAME = s.RDB$INDEX_NAME
-                    JOIN RDB$REF_CONSTRAINTS refc ON rc.RDB$CONSTRAINT_NAME = refc.RDB$CONSTRAINT_NAME
-                    JOIN RDB$RELATION_CONSTRAINTS rc2 ON refc.RDB$CONST_NAME_UQ = rc2.RDB$CONSTRAINT_NAME
-                    JOIN RDB$INDICES i2 ON rc2.RDB$INDEX_NAME = i2.RDB$INDEX_NAME
-                    JOIN RDB$INDEX_SEGMENTS s2 ON i2.RDB$INDEX_NAME = s2.RDB$INDEX_NAME
-                    WHERE rc.RDB$RELATION_NAME = ?
-                    AND rc.RDB$CONSTRAINT_TYPE = 'FOREIGN KEY'
-                    AND s.RDB$FIELD_POSITION = s2.RDB$FIELD_POSITION
-                    ORDER BY rc.RDB$CONSTRAINT_NAME, s.RDB$FIELD_POSITION
+                        TRIM(rf.RDB$FIELD_NAME) as column_name,
+                        CASE f.RDB$FIELD_TYPE
+                            WHEN 7 THEN 'SMALLINT'
+                            WHEN 8 THEN 'INTEGER'
+                            WHEN 10 THEN 'FLOAT'
+                            WHEN 12 THEN 'DATE'
+                            WHEN 13 THEN 'TIME'
+                            WHEN 14 THEN 'CHAR'
+                            WHEN 16 THEN 'BIGINT'
+                            WHEN 27 THEN 'DOUBLE PRECISION'
+                            WHEN 35 THEN 'TIMESTAMP'
+                            WHEN 37 THEN 'VARCHAR'
+                            WHEN 261 THEN 'BLOB'
+                            ELSE 'UNKNOWN'
+                        END as base_type,
+                        f.RDB$FIELD_LENGTH as field_length,
+                        f.RDB$FIELD_SCALE as field_scale,
+                        CASE WHEN rf.RDB$NULL_FLAG IS NULL THEN 'YES' ELSE 'NO' END as nullable,
+                        TRIM(rf.RDB$DEFAULT_SOURCE) as default_value,
+                        rf.RDB$FIELD_POSITION as "position"
+                    FROM RDB$RELATION_FIELDS rf
+                    JOIN RDB$FIELDS f ON rf.RDB$FIELD_SOURCE = f.RDB$FIELD_NAME
+                    WHERE rf.RDB$RELATION_NAME = ?
+                    ORDER BY rf.RDB$FIELD_POSITION
                 """, [table_name.upper()])
                 
-                foreign_keys = cursor.fetchall()
-            except Exception as e:
-                log(f"⚠️ Warning getting foreign keys for {table_name}: {e}")
-            
-            # Get indexes with error handling
-            indexes = []
-            try:
-                cursor.execute("""
-                    SELECT 
-                        TRIM(i.RDB$INDEX_NAME) as index_name,
-                        TRIM(s.RDB$FIELD_NAME) as column_name,
-                        i.RDB$UNIQUE_FLAG as is_unique
-                    FROM RDB$INDICES i
-                    JOIN RDB$INDEX_SEGMENTS s ON i.RDB$INDEX_NAME = s.RDB$INDEX_NAME
-                    WHERE i.RDB$RELATION_NAME = ?
-                    AND i.RDB$SYSTEM_FLAG = 0
-                    ORDER BY i.RDB$INDEX_NAME, s.RDB$FIELD_POSITION
-                """, [table_name.upper()])
+                columns_raw = cursor.fetchall()
                 
-                indexes = cursor.fetchall()
-            except Exception as e:
-                log(f"⚠️ Warning getting indexes for {table_name}: {e}")
-            
-            conn.close()
+                # Get primary key with error handling
+                primary_keys = []
+                try:
+                    cursor.execute("""
+                        SELECT TRIM(s.RDB$FIELD_NAME) as column_name
+                        FROM RDB$INDEX_SEGMENTS s
+                        JOIN RDB$INDICES i ON s.RDB$INDEX_NAME = i.RDB$INDEX_NAME
+                        JOIN RDB$RELATION_CONSTRAINTS rc ON i.RDB$INDEX_NAME = rc.RDB$INDEX_NAME
+                        WHERE rc.RDB$RELATION_NAME = ?
+                        AND rc.RDB$CONSTRAINT_TYPE = 'PRIMARY KEY'
+                        ORDER BY s.RDB$FIELD_POSITION
+                    """, [table_name.upper()])
+                
+                    primary_keys = [row[0] for row in cursor.fetchall()]
+                except Exception as e:
+                    log(f"⚠️ Warning getting primary keys for {table_name}: {e}")
+                
+                # Get foreign keys with error handling
+                foreign_keys = []
+                try:
+                    cursor.execute("""
+                        SELECT 
+                            TRIM(rc.RDB$CONSTRAINT_NAME) as constraint_name,
+                            TRIM(s.RDB$FIELD_NAME) as column_name,
+                            TRIM(rc2.RDB$RELATION_NAME) as referenced_table,
+                            TRIM(s2.RDB$FIELD_NAME) as referenced_column
+                        FROM RDB$RELATION_CONSTRAINTS rc
+                        JOIN RDB$INDICES i ON rc.RDB$INDEX_NAME = i.RDB$INDEX_NAME
+                        JOIN RDB$INDEX_SEGMENTS s ON i.RDB$INDEX_NAME = s.RDB$INDEX_NAME
+                        JOIN RDB$REF_CONSTRAINTS refc ON rc.RDB$CONSTRAINT_NAME = refc.RDB$CONSTRAINT_NAME
+                        JOIN RDB$RELATION_CONSTRAINTS rc2 ON refc.RDB$CONST_NAME_UQ = rc2.RDB$CONSTRAINT_NAME
+                        JOIN RDB$INDICES i2 ON rc2.RDB$INDEX_NAME = i2.RDB$INDEX_NAME
+                        JOIN RDB$INDEX_SEGMENTS s2 ON i2.RDB$INDEX_NAME = s2.RDB$INDEX_NAME
+                        WHERE rc.RDB$RELATION_NAME = ?
+                        AND rc.RDB$CONSTRAINT_TYPE = 'FOREIGN KEY'
+                        AND s.RDB$FIELD_POSITION = s2.RDB$FIELD_POSITION
+                        ORDER BY rc.RDB$CONSTRAINT_NAME, s.RDB$FIELD_POSITION
+                    """, [table_name.upper()])
+                
+                    foreign_keys = cursor.fetchall()
+                except Exception as e:
+                    log(f"⚠️ Warning getting foreign keys for {table_name}: {e}")
+                
+                # Get indexes with error handling
+                indexes = []
+                try:
+                    cursor.execute("""
+                        SELECT 
+                            TRIM(i.RDB$INDEX_NAME) as index_name,
+                            TRIM(s.RDB$FIELD_NAME) as column_name,
+                            i.RDB$UNIQUE_FLAG as is_unique
+                        FROM RDB$INDICES i
+                        JOIN RDB$INDEX_SEGMENTS s ON i.RDB$INDEX_NAME = s.RDB$INDEX_NAME
+                        WHERE i.RDB$RELATION_NAME = ?
+                        AND i.RDB$SYSTEM_FLAG = 0
+                        ORDER BY i.RDB$INDEX_NAME, s.RDB$FIELD_POSITION
+                    """, [table_name.upper()])
+                
+                    indexes = cursor.fetchall()
+                except Exception as e:
+                    log(f"⚠️ Warning getting indexes for {table_name}: {e}")
             
             # Format columns with proper data type formatting
             formatted_columns = []
@@ -1,62 +1,210 @@
 """MCP (Model Context Protocol) server implementation."""
 
-import json
 import sys
 import os
+import select
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Dict, Any
 
-from ..core.config import get_server_info
+from ..core.config import MCP_CONFIG, QUERY_CONFIG, get_server_info, log, flush_log, hold_log
 from ..core.i18n import I18n
+from ..core import serialization
 
-def log(message: str):
-    """Log to stderr - visible in Docker/Claude Desktop"""
-    print(f"[MCP-FIREBIRD] {message}", file=sys.stderr, flush=True)
 
 class MCPServer:
     """MCP protocol server handling JSON-RPC communication."""
     
+    # Held-back response bytes that force a flush even while input is queued
+    OUTPUT_BUFFER_SIZE = 1 << 17
+    
     def __init__(self, firebird_server, prompt_manager, prompt_generator, i18n: I18n):
         self.firebird_server = firebird_server
         self.prompt_manager = prompt_manager
         self.prompt_generator = prompt_generator
         self.i18n = i18n
+        # (expert mode enabled, encoded {"tools": [...]}, {name: encoded tool}) - see _tool_catalog
+        self._tools_list_cache = None
+        # Encoded initialize result; server info is fixed for the process
+        self._initialize_result = None
+        # server_status sections that cannot change while the process runs
+        self._static_status = None
+        # (table prompts list, encoded prompts/list result)
+        self._prompts_list_cache = None
+        # Encoded responses held back by run() until stdin has no pending input
+        self._pending_output = None
+        
+        # JSON-RPC method -> handler(request_id, params)
+        self._methods = {
+            "initialize": self.handle_initialize,
+            "tools/list": self.handle_tools_list,
+            "tools/call": self.handle_tools_call,
+            "tools/describe": self.handle_tools_describe,
+            "resources/list": self.handle_resources_list,
+            "prompts/list": self.handle_prompts_list,
+            "prompts/get": self.handle_prompts_get
+        }
+        
+        # JSON-RPC notification -> handler(params); notifications never get a response
+        self._notifications = {
+            "notifications/initialized": self.handle_initialized_notification
+        }
+        
+        # Tool name -> handler(arguments) returning the response text
+        self._tools = {
+            "test_connection": self._tool_test_connection,
+            "execute_query": self._tool_execute_query,
+            "execute_batch": self._tool_execute_batch,
+            "begin_transaction": self._tool_transaction(self.firebird_server.begin_transaction),
+            "commit_transaction": self._tool_transaction(self.firebird_server.commit_transaction),
+            "rollback_transaction": self._tool_transaction(self.firebird_server.rollback_transaction),
+            "list_tables": self._tool_list_tables,
+            "server_status": self._tool_server_status
+        }
         log(f"🚀 {self.i18n.get('server_info.initialized')}")
     
+    def _write_raw(self, data: bytes):
+        """Write one encoded JSON-RPC message as a line on stdout."""
+        if self._pending_output is not None:
+            self._pending_output += data + b"\n"
+            if len(self._pending_output) >= self.OUTPUT_BUFFER_SIZE:
+                self._flush_output()
+            return
+        self._write_stdout(data + b"\n")
+    
+    @staticmethod
+    def _write_stdout(data: bytes):
+        out = getattr(sys.stdout, 'buffer', None)
+        if out is None:
+            sys.stdout.write(data.decode())
+            sys.stdout.flush()
+            return
+        sys.stdout.flush()  # keep ordering with anything printed through the text layer
+        out.write(data)
+        out.flush()
+    
+    def _flush_output(self):
+        """Write all held-back responses to stdout in one call."""
+        if self._pending_output:
+            self._write_stdout(bytes(self._pending_output))
+            self._pending_output.clear()
+    
+    @staticmethod
+    def _input_pending(stream) -> bool:
+        """Return True if more input is already waiting on stream."""
+        try:
+            return bool(select.select([stream], [], [], 0)[0])
+        except (OSError, ValueError, TypeError, AttributeError):
+            # Not selectable (e.g. pipes on Windows): never hold output back
+            return False
+    
+    @staticmethod
+    def _read_bursts(stream):
+        """
+        Yield the complete lines received from stream, one list per read.
+        
+        Binary streams are read with read1(), which leaves nothing behind in
+        the stream's own buffer, so _input_pending() sees every queued byte
+        and a burst of requests is answered with one write. Other streams
+        (e.g. StringIO in tests) yield one line at a time.
+        """
+        read1 = getattr(stream, 'read1', None)
+        if read1 is None:
+            for line in stream:
+                yield (line,)
+            return
+        
+        partial = bytearray()
+        while True:
+            chunk = read1(65536)
+            if not chunk:
+                break
+            end = chunk.rfind(b"\n")
+            if end < 0:
+                partial += chunk  # a large request spread over several reads
+                continue
+            partial += chunk[:end]
+            lines = partial.split(b"\n")
+            partial = bytearray(chunk[end + 1:])
+            yield lines
+        if partial:
+            yield (partial,)
+    
     def send_response(self, request_id: Any, result: Any):
         """Send JSON-RPC response."""
-        response = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": result
-        }
-        print(json.dumps(response), flush=True)
+        self.send_response_raw(request_id, serialization.dumps_bytes(result))
+    
+    def send_response_raw(self, request_id: Any, result: bytes):
+        """Send JSON-RPC response whose result is already JSON-encoded."""
+        self._write_raw(
+            b'{"jsonrpc":"2.0","id":' + serialization.dumps_bytes(request_id)
+            + b',"result":' + result + b'}'
+        )
     
     def send_error(self, request_id: Any, code: int, message: str):
         """Send JSON-RPC error."""
-        response = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "error": {"code": code, "message": message}
-        }
-        print(json.dumps(response), flush=True)
+        self._write_raw(
+            b'{"jsonrpc":"2.0","id":' + serialization.dumps_bytes(request_id)
+            + b',"error":{"code":' + b'%d' % code
+            + b',"message":' + serialization.dumps_bytes(message) + b'}}'
+        )
     
     def handle_initialize(self, request_id: Any, params: Dict):
         """Handle MCP initialize request."""
-        server_info = get_server_info()
-        result = {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {
-                "tools": {"listChanged": False},
-                "resources": {"subscribe": False, "listChanged": False},
-                "prompts": {"listChanged": False}
-            },
-            "serverInfo": server_info
-        }
-        self.send_response(request_id, result)
+        if self._initialize_result is None:
+            result = {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "tools": {"listChanged": False},
+                    "resources": {"subscribe": False, "listChanged": False},
+                    "prompts": {"listChanged": False}
+                },
+                "serverInfo": get_server_info()
+            }
+            self._initialize_result = serialization.dumps_bytes(result)
+        self.send_response_raw(request_id, self._initialize_result)
     
     def handle_tools_list(self, request_id: Any, params: Dict):
         """List available tools with enhanced descriptions."""
-        tools = [
+        self.send_response_raw(request_id, self._tool_catalog()[1])
+    
+    def handle_tools_describe(self, request_id: Any, params: Dict):
+        """Return the full definition, including inputSchema, of one tool."""
+        tool_name = params.get("name")
+        tool = self._tool_catalog()[2].get(tool_name)
+        if tool is None:
+            self.send_error(request_id, -32602, f"{self.i18n.get('tools.unknown_tool')}: {tool_name}")
+            return
+        self.send_response_raw(request_id, tool)
+    
+    def _tool_catalog(self) -> tuple:
+        """
+        Return the cached (enabled, encoded tools/list result, encoded tools by name).
+        
+        The tool list only depends on the language and on whether expert mode
+        is enabled, so it is encoded once and spliced into each response. With
+        MCP_CONFIG['lazy_tool_schemas'] the list carries an empty object schema
+        per tool and clients fetch the real one through tools/describe.
+        """
+        enabled = self.prompt_manager.config['enabled']
+        if self._tools_list_cache is None or self._tools_list_cache[0] != enabled:
+            tools = self._build_tools()
+            listed = tools
+            if MCP_CONFIG['lazy_tool_schemas']:
+                listed = [
+                    {"name": tool["name"], "description": tool["description"], "inputSchema": {"type": "object"}}
+                    for tool in tools
+                ]
+            self._tools_list_cache = (
+                enabled,
+                serialization.dumps_bytes({"tools": listed}),
+                {tool["name"]: serialization.dumps_bytes(tool) for tool in tools}
+            )
+        return self._tools_list_cache
+    
+    def _build_tools(self) -> list:
+        """Build the tool definitions advertised by tools/list."""
+        return [
             {
                 "name": self.i18n.get('tools.test_connection.name'),
                 "description": self.prompt_manager.get_enhanced_tool_description(
@@ -92,6 +240,11 @@ class MCPServer:
                             "type": "array", 
                             "description": self.i18n.get('tools.execute_query.params_description')
                         },
+                        "format": {
+                            "type": "string",
+                            "description": self.i18n.get('tools.execute_query.format_description'),
+                            "enum": ["row", "column"]
+                        },
                         "disable_expert_mode": {
                             "type": "boolean",
                             "description": "Set to true to disable automatic expert context",
@@ -106,6 +259,42 @@ class MCPServer:
                     "required": ["sql"]
                 }
             },
+            {
+                "name": self.i18n.get('tools.execute_batch.name'),
+                "description": self.prompt_manager.get_enhanced_tool_description(
+                    'execute_batch',
+                    self.i18n.get('tools.execute_batch.description')
+                ),
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "sql": {
+                            "type": "string",
+                            "description": self.i18n.get('tools.execute_batch.sql_description')
+                        },
+                        "params_list": {
+                            "type": "array",
+                            "items": {"type": "array"},
+                            "description": self.i18n.get('tools.execute_batch.params_list_description')
+                        },
+                        "disable_expert_mode": {
+                            "type": "boolean",
+                            "description": "Set to true to disable automatic expert context",
+                            "default": False
+                        }
+                    },
+                    "required": ["sql", "params_list"]
+                }
+            },
+            *({
+                "name": self.i18n.get(f'tools.{name}.name'),
+                "description": self.i18n.get(f'tools.{name}.description'),
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            } for name in ("begin_transaction", "commit_transaction", "rollback_transaction")),
             {
                 "name": self.i18n.get('tools.list_tables.name'),
                 "description": self.prompt_manager.get_enhanced_tool_description(
@@ -134,8 +323,6 @@ class MCPServer:
                 }
             }
         ]
-        
-        self.send_response(request_id, {"tools": tools})
     
     def handle_resources_list(self, request_id: Any, params: Dict):
         """List available resources."""
@@ -143,18 +330,26 @@ class MCPServer:
         self.send_response(request_id, {"resources": resources})
     
     def handle_prompts_list(self, request_id: Any, params: Dict):
-        """List available prompts dynamically based on database tables."""
+        """
+        List available prompts dynamically based on database tables.
+        
+        The encoded result is reused while the generator keeps returning the
+        same table prompts list, i.e. until the table list is refreshed.
+        """
         table_prompts = self.prompt_generator.get_available_table_prompts()
         
-        prompts = []
-        for table_prompt in table_prompts:
-            prompts.append({
-                "name": table_prompt["name"],
-                "description": table_prompt["description"],
-                "arguments": []
-            })
+        cached = self._prompts_list_cache
+        if cached is None or cached[0] is not table_prompts:
+            prompts = []
+            for table_prompt in table_prompts:
+                prompts.append({
+                    "name": table_prompt["name"],
+                    "description": table_prompt["description"],
+                    "arguments": []
+                })
+            cached = self._prompts_list_cache = (table_prompts, serialization.dumps_bytes({"prompts": prompts}))
         
-        self.send_response(request_id, {"prompts": prompts})
+        self.send_response_raw(request_id, cached[1])
     
     def handle_prompts_get(self, request_id: Any, params: Dict):
         """Get specific prompt with dynamic context."""
@@ -185,115 +380,140 @@ class MCPServer:
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
         
-        disable_expert_mode = arguments.get("disable_expert_mode", False)
-        expert_operation = arguments.get("expert_operation", self.prompt_manager.config['operation_type'])
+        tool = self._tools.get(tool_name)
+        if tool is None:
+            self._send_tool_result(
+                request_id,
+                f"❌ {self.i18n.get('tools.error_executing')} {tool_name}: {self.i18n.get('tools.unknown_tool')}: {tool_name}",
+                True
+            )
+            return
         
         try:
-            if tool_name == "test_connection":
-                result_data = self.firebird_server.test_connection()
-                base_content = f"🔌 {self.i18n.get('connection.test_results')}:\n```json\n{json.dumps(result_data, indent=2)}\n```"
-                
-                enhanced_content = self.prompt_manager.apply_to_response(
-                    base_content, 
-                    tool_name, 
-                    disabled=disable_expert_mode
-                )
-                
-                content = [{
-                    "type": "text",
-                    "text": enhanced_content
-                }]
-            
-            elif tool_name == "execute_query":
-                sql = arguments.get("sql")
-                if not sql:
-                    raise ValueError(self.i18n.get('tools.sql_required'))
-                
-                params_list = arguments.get("params")
-                result_data = self.firebird_server.execute_query(sql, params_list)
-                
-                base_content = f"📊 {self.i18n.get('tools.query_results')}:\n```json\n{json.dumps(result_data, indent=2)}\n```"
-                
-                if not disable_expert_mode and expert_operation:
-                    original_operation = self.prompt_manager.config['operation_type']
-                    self.prompt_manager.config['operation_type'] = expert_operation
-                    
-                    enhanced_content = self.prompt_manager.apply_to_response(
-                        base_content, 
-                        tool_name, 
-                        disabled=False
-                    )
-                    
-                    self.prompt_manager.config['operation_type'] = original_operation
-                else:
-                    enhanced_content = self.prompt_manager.apply_to_response(
-                        base_content, 
-                        tool_name, 
-                        disabled=disable_expert_mode
-                    )
-                
-                content = [{
-                    "type": "text",
-                    "text": enhanced_content
-                }]
-            
-            elif tool_name == "list_tables":
-                result = self.firebird_server.get_tables()
-                base_content = f"📋 {self.i18n.get('tools.database_tables')}:\n```json\n{json.dumps(result, indent=2)}\n```"
-                
-                enhanced_content = self.prompt_manager.apply_to_response(
-                    base_content, 
-                    tool_name, 
-                    disabled=disable_expert_mode
-                )
-                
-                content = [{
-                    "type": "text",
-                    "text": enhanced_content
-                }]
-            
-            elif tool_name == "server_status":
-                status = self._get_server_status()
-                content = [{
-                    "type": "text",
-                    "text": f"🔍 {self.i18n.get('tools.server_status_title')}:\n```json\n{json.dumps(status, indent=2)}\n```"
-                }]
-            
-            else:
-                raise ValueError(f"{self.i18n.get('tools.unknown_tool')}: {tool_name}")
-            
-            self.send_response(request_id, {
-                "content": content,
-                "isError": False
-            })
-            
+            text = tool(arguments)
         except Exception as e:
-            error_content = [{
-                "type": "text",
-                "text": f"❌ {self.i18n.get('tools.error_executing')} {tool_name}: {str(e)}"
-            }]
-            self.send_response(request_id, {
-                "content": error_content,
-                "isError": True
-            })
+            self._send_tool_result(
+                request_id,
+                f"❌ {self.i18n.get('tools.error_executing')} {tool_name}: {str(e)}",
+                True
+            )
+            return
+        
+        self._send_tool_result(request_id, text, False)
+    
+    def _send_tool_result(self, request_id: Any, text: str, is_error: bool):
+        """
+        Send a tools/call result holding one text block.
+        
+        The text (often a large embedded JSON payload) is encoded once and
+        spliced into the fixed content envelope, without building the
+        wrapping dicts.
+        """
+        self.send_response_raw(
+            request_id,
+            b'{"content":[{"type":"text","text":' + serialization.dumps_bytes(text)
+            + (b'}],"isError":true}' if is_error else b'}],"isError":false}')
+        )
+    
+    def _apply_expert_context(self, base_content: str, tool_name: str, arguments: Dict) -> str:
+        """Apply the default expert context unless the caller disabled it."""
+        return self.prompt_manager.apply_to_response(
+            base_content, 
+            tool_name, 
+            disabled=arguments.get("disable_expert_mode", False)
+        )
+    
+    @staticmethod
+    def _dump_payload(data: Any) -> str:
+        """Serialize a tool result for embedding in text content (MCP_PRETTY_JSON indents it)."""
+        return serialization.dumps(data, pretty=MCP_CONFIG['pretty_json'])
+    
+    def _tool_test_connection(self, arguments: Dict) -> str:
+        result_data = self.firebird_server.test_connection(force=True)
+        base_content = f"🔌 {self.i18n.get('connection.test_results')}:\n```json\n{self._dump_payload(result_data)}\n```"
+        return self._apply_expert_context(base_content, "test_connection", arguments)
+    
+    def _tool_execute_query(self, arguments: Dict) -> str:
+        sql = arguments.get("sql")
+        if not sql:
+            raise ValueError(self.i18n.get('tools.sql_required'))
+        
+        params_list = arguments.get("params")
+        result_data = self.firebird_server.execute_query(sql, params_list, arguments.get("format"))
+        
+        base_content = f"📊 {self.i18n.get('tools.query_results')}:\n```json\n{self._dump_payload(result_data)}\n```"
+        
+        expert_operation = arguments.get("expert_operation", self.prompt_manager.config['operation_type'])
+        if arguments.get("disable_expert_mode", False) or not expert_operation:
+            return self._apply_expert_context(base_content, "execute_query", arguments)
+        
+        original_operation = self.prompt_manager.config['operation_type']
+        self.prompt_manager.config['operation_type'] = expert_operation
+        
+        enhanced_content = self.prompt_manager.apply_to_response(
+            base_content, 
+            "execute_query", 
+            disabled=False
+        )
+        
+        self.prompt_manager.config['operation_type'] = original_operation
+        return enhanced_content
+    
+    def _tool_execute_batch(self, arguments: Dict) -> str:
+        sql = arguments.get("sql")
+        if not sql:
+            raise ValueError(self.i18n.get('tools.sql_required'))
+        
+        params_list = arguments.get("params_list")
+        if not params_list or not isinstance(params_list, list):
+            raise ValueError(self.i18n.get('tools.params_list_required'))
+        
+        result_data = self.firebird_server.execute_batch(sql, params_list)
+        base_content = f"📦 {self.i18n.get('tools.batch_results')}:\n```json\n{self._dump_payload(result_data)}\n```"
+        return self._apply_expert_context(base_content, "execute_batch", arguments)
+    
+    def _tool_transaction(self, action):
+        """Wrap a transaction control method as a tool handler."""
+        def handler(arguments: Dict) -> str:
+            result = action()
+            return f"🔒 {self.i18n.get('tools.transaction_results')}:\n```json\n{self._dump_payload(result)}\n```"
+        return handler
+    
+    def _tool_list_tables(self, arguments: Dict) -> str:
+        result = self.firebird_server.get_tables()
+        base_content = f"📋 {self.i18n.get('tools.database_tables')}:\n```json\n{self._dump_payload(result)}\n```"
+        return self._apply_expert_context(base_content, "list_tables", arguments)
+    
+    def _tool_server_status(self, arguments: Dict) -> str:
+        status = self._get_server_status()
+        return f"🔍 {self.i18n.get('tools.server_status_title')}:\n```json\n{self._dump_payload(status)}\n```"
     
     def _get_server_status(self) -> Dict:
-        """Get comprehensive server status."""
+        """
+        Get comprehensive server status.
+        
+        The connection probe runs in a daemon thread while the local checks are
+        collected, and is abandoned after QUERY_CONFIG['status_timeout'] seconds.
+        Once a probe is cached it is served inline (no worker thread); an
+        expired one is returned as-is and refreshed in the background.
+        """
+        probe = None
         connection_test = None
         if self.firebird_server.fdb_available and self.firebird_server.client_available:
-            try:
-                connection_test = self.firebird_server.test_connection()
-            except:
-                connection_test = {"error": "Connection test failed"}
+            if self.firebird_server.has_probe:
+                # A cached probe (fresh or stale) is returned without blocking
+                connection_test = self.firebird_server.test_connection(stale_ok=True)
+            else:
+                # Daemon thread: a hung connect must not keep the process alive at exit
+                probe = Future()
+                threading.Thread(target=self._run_probe, args=(probe,), name="status-probe", daemon=True).start()
         
-        server_info = get_server_info()
+        static = self._static_status
+        if static is None:
+            static = self._static_status = self._build_static_status()
         
         status = {
-            "server_info": {
-                "name": server_info["name"],
-                "version": server_info["version"],
-                "python_version": sys.version
-            },
+            "server_info": static["server_info"],
             "internationalization": {
                 "current_language": self.i18n.language,
                 "fallback_language": self.i18n.fallback_language,
@@ -303,6 +523,61 @@ class MCPServer:
                 "has_fallback_loaded": bool(self.i18n.fallback_strings)
             },
             "default_prompt_system": self.prompt_manager.get_status(),
+            "fdb_python_library": static["fdb_python_library"],
+            "firebird_client_libraries": static["firebird_client_libraries"],
+            "database_config": static["database_config"],
+            "connection_test": connection_test,
+            "environment": static["environment"],
+            "features": static["features"],
+            "recommendations": static["recommendations"]
+        }
+        
+        # Add dynamic prompts information
+        table_prompts = self.prompt_generator.get_available_table_prompts()
+        status["dynamic_prompts"] = {
+            "available_table_schemas": len(table_prompts),
+            "tables": [prompt["title"] for prompt in table_prompts[:10]]  # Show first 10
+        }
+        
+        if probe is not None:
+            timeout = QUERY_CONFIG['status_timeout']
+            try:
+                status["connection_test"] = probe.result(timeout=timeout)
+            except FutureTimeoutError:
+                status["connection_test"] = {"error": f"Connection test timed out after {timeout:g}s"}
+            except Exception:
+                status["connection_test"] = {"error": "Connection test failed"}
+        
+        return status
+    
+    def _run_probe(self, probe: Future):
+        """Run the connection probe and publish its outcome on the given future."""
+        try:
+            probe.set_result(self.firebird_server.test_connection(stale_ok=True))
+        except Exception as e:
+            probe.set_exception(e)
+    
+    def _build_static_status(self) -> Dict:
+        """Build the server_status sections derived from startup state and environment."""
+        server_info = get_server_info()
+        recommendations = []
+        
+        if not self.firebird_server.fdb_available:
+            recommendations.append("Install FDB: pip install fdb==2.0.2")
+        
+        if not self.firebird_server.client_available:
+            recommendations.extend([
+                "Check if /opt/firebird/lib/libfbclient.so exists",
+                "Verify LD_LIBRARY_PATH includes Firebird library directory",
+                "Rebuild container if libraries are missing"
+            ])
+        
+        return {
+            "server_info": {
+                "name": server_info["name"],
+                "version": server_info["version"],
+                "python_version": sys.version
+            },
             "fdb_python_library": {
                 "available": self.firebird_server.fdb_available,
                 "version": self.firebird_server.fdb.__version__ if self.firebird_server.fdb_available else None,
@@ -316,7 +591,6 @@ class MCPServer:
             "database_config": {
                 "dsn": self.firebird_server.dsn
             },
-            "connection_test": connection_test,
             "environment": {
                 "LD_LIBRARY_PATH": os.getenv('LD_LIBRARY_PATH', 'not set'),
                 "FIREBIRD_HOME": os.getenv('FIREBIRD_HOME', 'not set'),
@@ -329,77 +603,85 @@ class MCPServer:
                 "expert_prompt_integration": True,
                 "dynamic_prompt_generation": True
             },
-            "recommendations": []
+            "recommendations": recommendations
         }
-        
-        if not self.firebird_server.fdb_available:
-            status["recommendations"].append("Install FDB: pip install fdb==2.0.2")
-        
-        if not self.firebird_server.client_available:
-            status["recommendations"].extend([
-                "Check if /opt/firebird/lib/libfbclient.so exists",
-                "Verify LD_LIBRARY_PATH includes Firebird library directory",
-                "Rebuild container if libraries are missing"
-            ])
-        
-        # Add dynamic prompts information
-        table_prompts = self.prompt_generator.get_available_table_prompts()
-        status["dynamic_prompts"] = {
-            "available_table_schemas": len(table_prompts),
-            "tables": [prompt["title"] for prompt in table_prompts[:10]]  # Show first 10
-        }
-        
-        return status
+    
+    def handle_initialized_notification(self, params: Dict):
+        """Handle the client's notifications/initialized message."""
+        log(f"📨 {self.i18n.get('errors.notification_received')}")
     
     def handle_request(self, request: Dict):
         """Process JSON-RPC request."""
+        if "id" not in request:
+            self._handle_notification(request)
+            return
+        
         try:
             method = request.get("method")
             request_id = request.get("id")
             params = request.get("params", {})
             
-            if method == "initialize":
-                self.handle_initialize(request_id, params)
-            elif method == "tools/list":
-                self.handle_tools_list(request_id, params)
-            elif method == "tools/call":
-                self.handle_tools_call(request_id, params)
-            elif method == "resources/list":
-                self.handle_resources_list(request_id, params)
-            elif method == "prompts/list":
-                self.handle_prompts_list(request_id, params)
-            elif method == "prompts/get":
-                self.handle_prompts_get(request_id, params)
-            elif method == "notifications/initialized":
-                log(f"📨 {self.i18n.get('errors.notification_received')}")
-            else:
+            handler = self._methods.get(method)
+            if handler is None:
                 self.send_error(request_id, -32601, f"{self.i18n.get('errors.method_not_found')}: {method}")
+            else:
+                handler(request_id, params)
                 
         except Exception as e:
             log(f"❌ {self.i18n.get('server_info.error_handling')}: {e}")
             self.send_error(request.get("id"), -32603, str(e))
     
+    def _handle_notification(self, request: Dict):
+        """
+        Process a JSON-RPC notification (a message without an id).
+        
+        Per JSON-RPC 2.0 no response is sent, not even for unknown methods
+        or handler errors, so nothing is built or serialized here.
+        """
+        method = request.get("method")
+        handler = self._notifications.get(method)
+        if handler is None:
+            log(f"📨 {self.i18n.get('errors.notification_ignored')}: {method}")
+            return
+        try:
+            handler(request.get("params", {}))
+        except Exception as e:
+            log(f"❌ {self.i18n.get('server_info.error_handling')}: {e}")
+    
     def run(self):
         """Main server loop."""
         log(f"👂 {self.i18n.get('server_info.waiting')}")
+        hold_log(False)
+        flush_log()  # startup output goes out before blocking on stdin
+        
+        # Read raw bytes: the JSON parser decodes UTF-8 itself and tolerates
+        # the trailing newline, so no text decoding or strip() is needed
+        stdin = getattr(sys.stdin, 'buffer', sys.stdin)
+        
+        # Responses are held while the client has more requests queued and
+        # written together once stdin drains, one write() per burst
+        self._pending_output = bytearray()
         
         try:
-            for line in sys.stdin:
-                line = line.strip()
-                if not line:
-                    continue
+            for lines in self._read_bursts(stdin):
+                for line in lines:
+                    if line and not line.isspace():
+                        try:
+                            request = serialization.loads(line)
+                            self.handle_request(request)
+                        except serialization.JSONDecodeError as e:
+                            log(f"❌ {self.i18n.get('server_info.invalid_json')}: {e}")
+                        except Exception as e:
+                            log(f"❌ {self.i18n.get('server_info.error_processing')}: {e}")
                 
-                try:
-                    request = json.loads(line)
-                    self.handle_request(request)
-                except json.JSONDecodeError as e:
-                    log(f"❌ {self.i18n.get('server_info.invalid_json')}: {e}")
-                except Exception as e:
-                    log(f"❌ {self.i18n.get('server_info.error_processing')}: {e}")
+                if not self._input_pending(stdin):
+                    self._flush_output()
                     
         except KeyboardInterrupt:
             log(f"🛑 {self.i18n.get('server_info.interrupted')}")
         except Exception as e:
             log(f"❌ {self.i18n.get('server_info.server_error')}: {e}")
         finally:
+            self._flush_output()
+            self._pending_output = None
             log(f"🔚 {self.i18n.get('server_info.shutting_down')}")
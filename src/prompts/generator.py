@@ -1,26 +1,55 @@
 """Dynamic prompt generation for table schemas."""
 
 from typing import Dict, List
-from ..core.config import DB_CONFIG
+from ..core.cache import memoize_method
+from ..core.config import DB_CONFIG, CACHE_CONFIG
 from ..core.i18n import I18n
 
+
+class _PromptError(Exception):
+    """A prompt could not be built; the message is the localized text returned instead."""
+
+
 class PromptGenerator:
     """Generate dynamic prompts based on database schema."""
     
     def __init__(self, firebird_server=None, i18n: I18n = None):
         self.firebird_server = firebird_server
         self.i18n = i18n or I18n()
+        # (get_tables result, prompts built from it); get_tables returns the
+        # same cached dict until its TTL expires or DDL runs
+        self._table_prompts = None
     
     def generate(self, prompt_name: str, arguments: Dict) -> str:
-        """Generate prompt with dynamic context."""
-        if prompt_name.endswith("_schema"):
-            table_name = prompt_name.replace("_schema", "")
-            return self._generate_table_schema_prompt(table_name)
-        else:
+        """
+        Generate prompt with dynamic context.
+        
+        Built prompts are memoized per (prompt, arguments) and the server's
+        metadata_version, so DDL refreshes them immediately; failures are
+        returned as localized text but never cached.
+        """
+        if not prompt_name.endswith("_schema"):
             raise ValueError(f"Unknown prompt: {prompt_name}")
+        
+        try:
+            return self._generate_cached(
+                prompt_name, arguments, getattr(self.firebird_server, 'metadata_version', 0)
+            )
+        except _PromptError as e:
+            return str(e)
+    
+    @memoize_method(maxsize=64, ttl=CACHE_CONFIG['prompt_ttl'])
+    def _generate_cached(self, prompt_name: str, arguments: Dict, metadata_version: int) -> str:
+        """Build a prompt; raises _PromptError so failures bypass the memo."""
+        return self._build_table_schema_prompt(prompt_name.replace("_schema", ""))
     
     def get_available_table_prompts(self) -> List[Dict[str, str]]:
-        """Get list of available table schema prompts."""
+        """
+        Get list of available table schema prompts.
+        
+        The list is rebuilt only when get_tables returns a new result, so the
+        same list object is returned between refreshes; callers must not mutate it.
+        """
         if not self.firebird_server:
             return []
         
@@ -29,6 +58,10 @@ class PromptGenerator:
             if not tables_result.get("success"):
                 return []
             
+            cached = self._table_prompts
+            if cached is not None and cached[0] is tables_result:
+                return cached[1]
+            
             prompts = []
             for table_name in tables_result["tables"]:
                 prompts.append({
@@ -37,20 +70,30 @@ class PromptGenerator:
                     "title": f"{table_name} schema"
                 })
             
+            self._table_prompts = (tables_result, prompts)
             return prompts
             
         except Exception:
             return []
     
     def _generate_table_schema_prompt(self, table_name: str) -> str:
-        """Generate schema prompt for a specific table."""
+        """Generate schema prompt for a specific table, or the localized error text."""
+        try:
+            return self._build_table_schema_prompt(table_name)
+        except _PromptError as e:
+            return str(e)
+    
+    def _build_table_schema_prompt(self, table_name: str) -> str:
+        """Build the schema prompt for a table, raising _PromptError on failure."""
         if not self.firebird_server:
-            return self.i18n.get('table_schema.no_server_error')
+            raise _PromptError(self.i18n.get('table_schema.no_server_error'))
         
         try:
             schema = self.firebird_server.get_table_schema(table_name)
             if not schema.get("success"):
-                return self.i18n.get('table_schema.schema_error', table_name=table_name, error=schema.get('error', 'Unknown error'))
+                raise _PromptError(self.i18n.get('table_schema.schema_error', table_name=table_name, error=schema.get('error', 'Unknown error')))
+            
+            labels = self._schema_labels()
             
             # Build schema information
             content = []
@@ -58,28 +101,32 @@ class PromptGenerator:
             content.append("")
             
             # Table info
-            content.append(self.i18n.get('table_schema.table_info'))
-            content.append(f"- {self.i18n.get('table_schema.table_name')}: {table_name}")
-            content.append(f"- {self.i18n.get('table_schema.database')}: {DB_CONFIG['database']}")
+            content.append(labels['table_info'])
+            content.append(f"- {labels['table_name']}: {table_name}")
+            content.append(f"- {labels['database']}: {DB_CONFIG['database']}")
             content.append("")
             
             # Columns
-            content.append(self.i18n.get('table_schema.columns_header'))
+            content.append(labels['columns_header'])
+            column_line = labels['column_line']
             for col in schema["columns"]:
-                nullable = self.i18n.get('table_schema.nullable_yes') if col["nullable"] == "YES" else self.i18n.get('table_schema.nullable_no')
-                default = col.get("default_value") or self.i18n.get('table_schema.no_default')
-                content.append(f"- {col['column_name']}: {col['data_type']} | {self.i18n.get('table_schema.nullable')}: {nullable} | {self.i18n.get('table_schema.default')}: {default}")
+                content.append(column_line.format(
+                    name=col['column_name'],
+                    type=col['data_type'],
+                    nullable=labels['nullable_yes'] if col["nullable"] == "YES" else labels['nullable_no'],
+                    default=col.get("default_value") or labels['no_default']
+                ))
             content.append("")
             
             # Primary keys
             if schema["primary_keys"]:
-                content.append(self.i18n.get('table_schema.primary_keys_header'))
+                content.append(labels['primary_keys_header'])
                 content.append(f"- {', '.join(schema['primary_keys'])}")
                 content.append("")
             
             # Foreign keys
             if schema["foreign_keys"]:
-                content.append(self.i18n.get('table_schema.foreign_keys_header'))
+                content.append(labels['foreign_keys_header'])
                 fk_groups = {}
                 for fk in schema["foreign_keys"]:
                     ref_table = fk["referenced_table"]
@@ -88,12 +135,12 @@ class PromptGenerator:
                     fk_groups[ref_table].append(f"{fk['column_name']} -> {fk['referenced_column']}")
                 
                 for ref_table, relationships in fk_groups.items():
-                    content.append(f"- {self.i18n.get('table_schema.references')} {ref_table}: {', '.join(relationships)}")
+                    content.append(f"- {labels['references']} {ref_table}: {', '.join(relationships)}")
                 content.append("")
             
             # Indexes
             if schema["indexes"]:
-                content.append(self.i18n.get('table_schema.indexes_header'))
+                content.append(labels['indexes_header'])
                 idx_groups = {}
                 for idx in schema["indexes"]:
                     idx_name = idx["index_name"]
@@ -105,35 +152,49 @@ class PromptGenerator:
                     idx_groups[idx_name]["columns"].append(idx["column_name"])
                 
                 for idx_name, info in idx_groups.items():
-                    unique_text = self.i18n.get('table_schema.unique') if info["unique"] else self.i18n.get('table_schema.non_unique')
+                    unique_text = labels['unique'] if info["unique"] else labels['non_unique']
                     content.append(f"- {idx_name} ({unique_text}): {', '.join(info['columns'])}")
                 content.append("")
             
             # Usage guidance
-            content.append(self.i18n.get('table_schema.usage_guidance'))
-            content.append(f"- {self.i18n.get('table_schema.select_guidance')}")
-            content.append(f"- {self.i18n.get('table_schema.join_guidance')}")
-            content.append(f"- {self.i18n.get('table_schema.insert_guidance')}")
-            content.append(f"- {self.i18n.get('table_schema.update_guidance')}")
+            content.append(labels['usage_block'])
             
             return "\n".join(content)
             
+        except _PromptError:
+            raise
         except Exception as e:
-            return self.i18n.get('table_schema.generation_error', table_name=table_name, error=str(e))
+            raise _PromptError(self.i18n.get('table_schema.generation_error', table_name=table_name, error=str(e))) from e
     
-    def _get_firebird_version(self) -> str:
-        """Obter versão Firebird do servidor conectado."""
-        if self.firebird_server:
-            try:
-                result = self.firebird_server.test_connection()
-                if result.get("connected") and result.get("version"):
-                    return result["version"]
-            except:
-                pass
-        return "5.0+"  # fallback
-    
-
+    def _schema_labels(self) -> Dict[str, str]:
+        """
+        Resolve the table schema prompt's fixed strings once per string table.
+        
+        Per-column labels are folded into a single format string, and the
+        closing guidance section is pre-joined, so building a prompt only
+        formats the table-specific values.
+        """
+        cached = getattr(self, '_labels', None)
+        if cached is not None and cached[0] is self.i18n.strings:
+            return cached[1]
+        
+        get = self.i18n.get
+        labels = {key: get(f'table_schema.{key}') for key in (
+            'table_info', 'table_name', 'database', 'columns_header', 'nullable_yes',
+            'nullable_no', 'no_default', 'primary_keys_header', 'foreign_keys_header',
+            'references', 'indexes_header', 'unique', 'non_unique'
+        )}
+        nullable = get('table_schema.nullable').replace('{', '{{').replace('}', '}}')
+        default = get('table_schema.default').replace('{', '{{').replace('}', '}}')
+        labels['column_line'] = f"- {{name}}: {{type}} | {nullable}: {{nullable}} | {default}: {{default}}"
+        labels['usage_block'] = "\n".join([get('table_schema.usage_guidance')] + [
+            f"- {get(f'table_schema.{key}')}"
+            for key in ('select_guidance', 'join_guidance', 'insert_guidance', 'update_guidance')
+        ])
+        self._labels = (self.i18n.strings, labels)
+        return labels
     
     def register_firebird_server(self, server):
         """Register FirebirdMCPServer instance for dynamic context."""
         self.firebird_server = server
+        PromptGenerator._generate_cached.cache_clear(self)
@@ -1,12 +1,10 @@
 """Compact prompt manager - minimal auto-context application."""
 
 import sys
-from ..core.config import DEFAULT_PROMPT_CONFIG, DB_CONFIG
+from ..core.cache import memoize_method
+from ..core.config import DEFAULT_PROMPT_CONFIG, DB_CONFIG, CACHE_CONFIG, log
 from ..core.i18n import I18n
 
-def log(message: str):
-    """Log to stderr - visible in Docker/Claude Desktop"""
-    print(f"[MCP-FIREBIRD] {message}", file=sys.stderr, flush=True)
 
 class DefaultPromptManager:
     """Minimal prompt manager with reduced token usage."""
@@ -23,18 +21,27 @@ class DefaultPromptManager:
         
         if self.config['enabled']:
             log(f"📝 {self.i18n.get('prompts.manager.active_prompt')}: {self.config['prompt_name']}")
-            log(f"🎯 Expert context will be applied to: execute_query, test_connection, list_tables")
+            log(f"🎯 Expert context will be applied to: execute_query, execute_batch, test_connection, list_tables")
     
     def _get_firebird_version(self) -> str:
         """Obter versão Firebird do servidor conectado."""
-        if self.firebird_server:
+        try:
+            return self._probe_firebird_version()
+        except LookupError:
+            return "5.0+"  # fallback, not memoized so the next call probes again
+    
+    @memoize_method(maxsize=1, ttl=CACHE_CONFIG['prompt_ttl'])
+    def _probe_firebird_version(self) -> str:
+        """Return the connected server's version; raises LookupError when it is unknown."""
+        server = self.firebird_server
+        if server and server.fdb_available and server.client_available:
             try:
-                result = self.firebird_server.test_connection()
-                if result.get("connected") and result.get("version"):
-                    return result["version"]
-            except:
-                pass
-        return "5.0+"  # fallback
+                result = server.test_connection(stale_ok=True)
+            except Exception as e:
+                raise LookupError("Firebird version unavailable") from e
+            if result.get("connected") and result.get("version"):
+                return result["version"]
+        raise LookupError("Firebird version unavailable")
     
     def get_default_context(self) -> str:
         """Generate minimal context (~50 tokens vs 200+)."""
@@ -43,11 +50,19 @@ class DefaultPromptManager:
             return ""
         
         try:
-            template = self.i18n.get('prompts.manager')
-            env_info = f"{DB_CONFIG['host']}:{DB_CONFIG['port']}"
-            version = self._get_firebird_version()
-            
-            context = f"""{template['expert_title'].format(version=version)}
+            return self._build_default_context(self._get_firebird_version())
+        except Exception as e:
+            # Failures are raised past the memo so the next call retries
+            log(f"⚠️ Context error: {e}")
+            return ""
+    
+    @memoize_method(maxsize=1, ttl=CACHE_CONFIG['prompt_ttl'])
+    def _build_default_context(self, version: str) -> str:
+        """Build the compact context; cached per version since it does not depend on the response content."""
+        template = self.i18n.get('prompts.manager')
+        env_info = f"{DB_CONFIG['host']}:{DB_CONFIG['port']}"
+        
+        context = f"""{template['expert_title'].format(version=version)}
 
 {template['environment'].format(env=env_info)}
 {template['guidelines']}
@@ -55,11 +70,8 @@ class DefaultPromptManager:
 {template['separator']}
 
 """
-            log(f"🎯 Generated compact context ({len(context)} chars) with version {version}")
-            return context
-        except Exception as e:
-            log(f"⚠️ Context error: {e}")
-            return ""
+        log(f"🎯 Generated compact context ({len(context)} chars) with version {version}")
+        return context
     
     def apply_to_response(self, content: str, tool_name: str = None, disabled: bool = False) -> str:
         """Apply minimal context to main database tools (como original)."""
@@ -78,7 +90,7 @@ class DefaultPromptManager:
             return content
         
         # Aplica nas mesmas tools que antes, mas com context compacto
-        target_tools = ['execute_query', 'test_connection', 'list_tables']
+        target_tools = ['execute_query', 'execute_batch', 'test_connection', 'list_tables']
         if tool_name in target_tools:
             context = self.get_default_context()
             if context:
@@ -97,7 +109,7 @@ class DefaultPromptManager:
             return original_desc
         
         # Aplica enhancement nas mesmas tools que antes
-        target_tools = ['execute_query', 'test_connection', 'list_tables']
+        target_tools = ['execute_query', 'execute_batch', 'test_connection', 'list_tables']
         if tool_name in target_tools:
             template = self.i18n.get('prompts.manager')
             return f"{original_desc}\n\n🎯 {template['auto_expert_mode']}"
@@ -0,0 +1,396 @@
+"""Unit tests for FirebirdMCPServer connection handling."""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from firebird.server import FirebirdMCPServer
+
+
+def make_server():
+    """Build a server whose fdb module hands out fresh mock connections."""
+    fdb = Mock()
+    fdb.__version__ = "2.0.2"
+
+    def connect(**kwargs):
+        conn = Mock()
+        conn.cursor.return_value.fetchone.return_value = ("5.0.1", "SYSDBA", "2024-01-01 12:00:00")
+        conn.cursor.return_value.fetchall.return_value = []
+        conn.cursor.return_value.fetchmany.return_value = []
+        conn.cursor.return_value.description = [("NAME",)]
+        return conn
+
+    fdb.connect.side_effect = connect
+    return FirebirdMCPServer(fdb_module=fdb, fdb_available=True, client_available=True), fdb
+
+
+def idle_connection(server):
+    """Return the connection at the head of the idle pool."""
+    return server._pool.queue[0][0]
+
+
+class TestConnectionPool:
+    """Test cases for pooled connection reuse."""
+
+    def test_connection_is_reused(self):
+        """Test that consecutive calls share one pooled connection."""
+        server, fdb = make_server()
+
+        assert server.test_connection()["connected"] is True
+        assert server.get_tables()["success"] is True
+        assert server.execute_query("SELECT 1 FROM RDB$DATABASE")["success"] is True
+
+        assert fdb.connect.call_count == 1
+
+    def test_connection_diagnostics_in_one_query(self):
+        """Test that version, user and server time come from one query."""
+        server, fdb = make_server()
+
+        result = server.test_connection()
+
+        cursor = idle_connection(server).cursor.return_value
+        prepared = [call.args[0] for call in cursor.prep.call_args_list]
+        assert prepared.count(server.DIAG_SQL) == 1
+        assert result["version"] == "5.0.1"
+        assert result["current_user"] == "SYSDBA"
+        assert result["server_time"] == "2024-01-01 12:00:00"
+
+    def test_stale_connection_is_replaced(self):
+        """Test that a connection failing the liveness probe is discarded."""
+        server, fdb = make_server()
+        server.test_connection()
+
+        stale = idle_connection(server)
+        stale.cursor.return_value.execute.side_effect = Exception("connection lost")
+        server.VALIDATE_AFTER_IDLE = 0
+
+        assert server.test_connection(force=True)["connected"] is True
+        assert fdb.connect.call_count == 2
+        stale.close.assert_called_once()
+
+    def test_connection_survives_statement_error(self):
+        """Test that a healthy connection is kept after a failing statement."""
+        server, fdb = make_server()
+
+        with pytest.raises(RuntimeError):
+            with server._acquire():
+                raise RuntimeError("syntax error")
+
+        assert server._pool.qsize() == 1
+        assert fdb.connect.call_count == 1
+
+    def test_broken_connection_is_discarded(self):
+        """Test that a connection whose rollback fails is closed, not reused."""
+        server, fdb = make_server()
+
+        with pytest.raises(RuntimeError):
+            with server._acquire() as conn:
+                conn.rollback.side_effect = Exception("connection lost")
+                raise RuntimeError("network error")
+
+        assert server._pool.qsize() == 0
+        assert server._pool_size == 0
+        assert server.test_connection()["connected"] is True
+
+    def test_read_retried_after_connection_loss(self):
+        """Test that a read on a connection lost mid-call is retried on a new one."""
+        server, fdb = make_server()
+        server.test_connection()
+
+        dead = idle_connection(server)
+        dead.cursor.return_value.execute.side_effect = Exception("connection shutdown")
+
+        assert server.get_tables()["success"] is True
+        assert fdb.connect.call_count == 2
+        dead.close.assert_called_once()
+
+    def test_read_error_on_live_connection_is_not_retried(self):
+        """Test that a failing query on a healthy connection reports the error."""
+        server, fdb = make_server()
+        server.test_connection()
+
+        cursor = idle_connection(server).cursor.return_value
+        cursor.fetchall.side_effect = Exception("Table unknown")
+
+        assert server.get_table_info("MISSING")["success"] is False
+        assert fdb.connect.call_count == 1
+
+    def test_statements_are_prepared_once(self):
+        """Test that repeated queries reuse the prepared statement."""
+        server, fdb = make_server()
+
+        server.get_tables()
+        server.get_tables()
+        server.execute_query("SELECT NAME FROM USERS")
+        server.execute_query("SELECT NAME FROM USERS")
+
+        conn = idle_connection(server)
+        assert conn.cursor.return_value.prep.call_count == 2
+
+    def test_cursor_is_reused(self):
+        """Test that one cursor serves every call on a pooled connection."""
+        server, fdb = make_server()
+
+        server.test_connection()
+        server.get_tables()
+        server.execute_query("SELECT NAME FROM USERS")
+        server.get_table_info("USERS")
+
+        assert idle_connection(server).cursor.call_count == 1
+
+    def test_commented_sql_is_not_cached(self):
+        """Test that commented ad-hoc SQL bypasses the statement cache."""
+        server, fdb = make_server()
+
+        server.execute_query("SELECT NAME FROM USERS -- first try")
+        server.execute_query("SELECT NAME FROM USERS -- second try")
+
+        conn = idle_connection(server)
+        assert conn.cursor.return_value.prep.call_count == 0
+        assert server._statements[id(conn)][1] == {}
+
+    def test_tables_cached_until_ddl(self):
+        """Test that list results are cached and dropped after DDL."""
+        server, fdb = make_server()
+
+        server.get_tables()
+        server.get_tables()
+        conn = idle_connection(server)
+        assert conn.cursor.return_value.prep.call_count == 1
+
+        server.execute_query("CREATE TABLE T (ID INTEGER)")
+        assert server._tables_cache is None
+
+    def test_tables_keep_null_descriptions(self):
+        """Test that get_tables maps rows straight to names and descriptions."""
+        server, fdb = make_server()
+        server.test_connection()
+        idle_connection(server).cursor.return_value.fetchall.return_value = [("USERS", None), ("ORDERS", "Pedidos")]
+
+        result = server.get_tables()
+
+        assert result["tables"] == ["USERS", "ORDERS"]
+        assert result["tables_detailed"] == [
+            {"name": "USERS", "description": None},
+            {"name": "ORDERS", "description": "Pedidos"},
+        ]
+
+    def test_ddl_closes_cached_statements_first(self):
+        """Test that cached statements (table existence locks) are closed before DDL runs."""
+        server, fdb = make_server()
+        server.get_tables()
+        cursor = idle_connection(server).cursor.return_value
+        cached = cursor.prep.return_value
+        closed_at_ddl = []
+        cursor.execute.side_effect = lambda *args: closed_at_ddl.append(cached.close.called)
+
+        assert server.execute_query("DROP TABLE USERS")["success"] is True
+
+        cursor.execute.assert_called_with("DROP TABLE USERS")
+        assert closed_at_ddl == [True]
+        assert server._statements[id(idle_connection(server))][1] == {}
+
+    def test_ddl_closes_statements_on_idle_connections(self):
+        """Test that idle pooled connections release their statements before DDL."""
+        server, fdb = make_server()
+        with server._acquire() as first:
+            with server._acquire() as second:
+                for conn in (first, second):
+                    server._prepared(conn, server.TABLES_SQL)
+        statements = [conn.cursor.return_value.prep.return_value for conn in (first, second)]
+
+        server.execute_query("ALTER TABLE USERS ADD X INTEGER")
+
+        for statement in statements:
+            statement.close.assert_called_once()
+
+    def test_dml_is_not_cached(self):
+        """Test that one-off DML and batch statements stay out of the statement cache."""
+        server, fdb = make_server()
+
+        server.execute_query("INSERT INTO T (ID) VALUES (1)")
+        server.execute_batch("INSERT INTO T (ID) VALUES (?)", [[2], [3]])
+
+        conn = idle_connection(server)
+        assert server._statements[id(conn)][1] == {}
+        conn.cursor.return_value.prep.return_value.close.assert_called_once()
+
+    def test_select_is_capped_at_max_rows(self, monkeypatch):
+        """Test that SELECT results stop at QUERY_CONFIG['max_rows']."""
+        from core.config import QUERY_CONFIG
+        monkeypatch.setitem(QUERY_CONFIG, 'max_rows', 3)
+        monkeypatch.setitem(QUERY_CONFIG, 'fetch_size', 2)
+        server, fdb = make_server()
+
+        server.test_connection()
+        cursor = idle_connection(server).cursor.return_value
+        cursor.fetchmany.side_effect = lambda size: [("x",)] * size
+
+        result = server.execute_query("SELECT NAME FROM USERS")
+
+        assert result["row_count"] == 3
+        assert result["truncated"] is True
+
+    def test_columnar_result_format(self, monkeypatch):
+        """Test the columns/rows result shape when legacy format is off."""
+        from core.config import QUERY_CONFIG
+        monkeypatch.setitem(QUERY_CONFIG, 'legacy_dict_format', False)
+        server, fdb = make_server()
+
+        server.test_connection()
+        cursor = idle_connection(server).cursor.return_value
+        cursor.fetchmany.side_effect = [[("Ana",), ("Bia",)], []]
+
+        result = server.execute_query("SELECT NAME FROM USERS")
+
+        assert result["columns"] == ["NAME"]
+        assert result["rows"] == [("Ana",), ("Bia",)]
+        assert "data" not in result
+
+    def test_row_dicts_from_generated_builder(self):
+        """Test that row dicts match dict(zip()) for odd and duplicate column names."""
+        server, fdb = make_server()
+
+        server.test_connection()
+        cursor = idle_connection(server).cursor.return_value
+        cursor.description = [("ID",), ("it's \"q\"",), ("ID",)]
+        cursor.fetchmany.side_effect = [[(1, "a", 2), (3, "b", 4)], []]
+
+        result = server.execute_query("SELECT ID, X, ID FROM T")
+
+        assert result["data"] == [{"ID": 2, "it's \"q\"": "a"}, {"ID": 4, "it's \"q\"": "b"}]
+
+    def test_large_result_switches_to_columnar(self, monkeypatch):
+        """Test that results above columnar_threshold skip per-row dicts."""
+        from core.config import QUERY_CONFIG
+        monkeypatch.setitem(QUERY_CONFIG, 'columnar_threshold', 2)
+        server, fdb = make_server()
+
+        server.test_connection()
+        cursor = idle_connection(server).cursor.return_value
+        cursor.fetchmany.side_effect = [[("Ana",), ("Bia",)], []]
+        assert server.execute_query("SELECT NAME FROM USERS")["data"] == [{"NAME": "Ana"}, {"NAME": "Bia"}]
+
+        cursor.fetchmany.side_effect = [[("Ana",), ("Bia",), ("Caio",)], []]
+        result = server.execute_query("SELECT NAME FROM USERS")
+        assert result["rows"] == [("Ana",), ("Bia",), ("Caio",)]
+        assert "data" not in result
+
+    def test_column_result_format(self):
+        """Test that format="column" returns one array per column."""
+        server, fdb = make_server()
+
+        server.test_connection()
+        cursor = idle_connection(server).cursor.return_value
+        cursor.description = [("ID",), ("NAME",)]
+        cursor.fetchmany.side_effect = [[(1, "Ana"), (2, "Bia")], []]
+
+        result = server.execute_query("SELECT ID, NAME FROM USERS", result_format="column")
+
+        assert result["columns"] == ["ID", "NAME"]
+        assert result["data"] == [[1, 2], ["Ana", "Bia"]]
+        assert result["row_count"] == 2
+
+    def test_execute_batch_prepares_once_and_commits(self):
+        """Test that a batch reuses one statement and commits once."""
+        server, fdb = make_server()
+
+        server.test_connection()
+        conn = idle_connection(server)
+        conn.cursor.return_value.rowcount = 1
+
+        result = server.execute_batch("INSERT INTO T (ID) VALUES (?)", [[1], [2], [3]])
+
+        assert result["success"] is True
+        assert result["row_counts"] == [1, 1, 1]
+        conn.cursor.return_value.prep.assert_called_with("INSERT INTO T (ID) VALUES (?)")
+        assert conn.cursor.return_value.prep.call_count == 2  # diagnostics + batch statement
+        conn.commit.assert_called_once()
+
+    def test_transaction_groups_statements_in_one_commit(self):
+        """Test that DML inside an explicit transaction commits only once."""
+        server, fdb = make_server()
+
+        assert server.begin_transaction()["success"] is True
+        assert server.begin_transaction()["success"] is False
+        conn = server._tx_conn
+
+        server.execute_query("INSERT INTO T (ID) VALUES (1)")
+        server.execute_batch("INSERT INTO T (ID) VALUES (?)", [[2], [3]])
+        conn.commit.assert_not_called()
+
+        assert server.commit_transaction()["success"] is True
+        conn.commit.assert_called_once()
+        assert server._tx_conn is None
+        assert idle_connection(server) is conn
+        assert server.commit_transaction()["success"] is False
+
+    def test_leading_comment_select_returns_rows(self):
+        """Test that a SELECT preceded by comments is fetched as a result set."""
+        server, fdb = make_server()
+
+        result = server.execute_query("-- active users\n/* report */ SELECT NAME FROM USERS")
+
+        assert result["success"] is True
+        assert "data" in result
+
+    def test_cte_query_returns_rows(self):
+        """Test that a WITH ... SELECT query is fetched, not committed as DML."""
+        server, fdb = make_server()
+
+        result = server.execute_query("WITH T AS (SELECT NAME FROM USERS) SELECT NAME FROM T")
+
+        assert result["success"] is True
+        assert "data" in result
+        assert result["analysis"]["type"] == "select"
+        idle_connection(server).commit.assert_not_called()
+
+    def test_connection_probe_is_cached(self):
+        """Test that status polls reuse a recent probe unless forced."""
+        server, fdb = make_server()
+
+        first = server.test_connection()
+        assert server.test_connection() is first
+        assert server.test_connection(force=True) is not first
+
+    def test_stale_probe_is_served_while_revalidating(self):
+        """Test that stale_ok returns the expired probe and refreshes it in the background."""
+        server, fdb = make_server()
+
+        first = server.test_connection()
+        server._last_probe = (server._last_probe[0] - 3600, first)
+
+        assert server.test_connection(stale_ok=True) is first
+        assert server._probe_lock.acquire(timeout=5)
+        server._probe_lock.release()
+        assert server.test_connection() is not first
+
+    def test_has_probe_after_first_test(self):
+        """Test that has_probe reports whether a probe result is cached."""
+        server, fdb = make_server()
+
+        assert server.has_probe is False
+        server.test_connection()
+        assert server.has_probe is True
+
+    @pytest.mark.parametrize("message,error_type", [
+        ("network error - connection refused", "network_error"),
+        ("login failed - invalid password", "authentication_error"),
+        ("Database not found", "database_error"),
+        ("libtommath.so.0: cannot open shared object", "dependency_error"),
+        ("The location of Firebird Client Library could not be determined.", "client_library_error"),
+        ("something else", "unknown_error"),
+    ])
+    def test_connection_error_classification(self, message, error_type):
+        """Test that connection errors are classified with the matching hint."""
+        server, fdb = make_server()
+        fdb.connect.side_effect = Exception(message)
+
+        result = server.test_connection()
+
+        assert result["connected"] is False
+        assert result["type"] == error_type
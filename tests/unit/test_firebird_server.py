@@ -7,6 +7,8 @@ from unittest.mock import Mock, patch, MagicMock
 import pytest
 
 import server
+from src.core import config
+from src.core.config import flush_log, hold_log
 
 
 class TestFirebirdMCPServer:
@@ -387,9 +389,46 @@ class TestUtilityFunctions:
     def test_log_function(self, capsys):
         """Testa função de log."""
         server.log("Test message")
+        flush_log()
         captured = capsys.readouterr()
         assert "[MCP-FIREBIRD] Test message" in captured.err
 
+    @pytest.mark.unit
+    def test_log_is_buffered_until_flush(self, capsys):
+        """Testa que linhas comuns ficam no buffer e erros saem na hora."""
+        hold_log()
+        try:
+            server.log("Buffered message")
+            assert "Buffered message" not in capsys.readouterr().err
+
+            server.log("❌ Error message")
+            captured = capsys.readouterr().err
+            assert "[MCP-FIREBIRD] Buffered message" in captured
+            assert "[MCP-FIREBIRD] ❌ Error message" in captured
+
+            server.log("Later message")
+            flush_log()
+            assert "[MCP-FIREBIRD] Later message" in capsys.readouterr().err
+        finally:
+            hold_log(False)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("level,expected", [
+        ('info', ["Info message", "⚠️  Warning message", "❌ Error message", "  CRITICAL indented"]),
+        ('warning', ["⚠️  Warning message", "❌ Error message", "  CRITICAL indented"]),
+        ('error', ["❌ Error message", "  CRITICAL indented"]),
+    ])
+    def test_log_level_filter(self, capsys, monkeypatch, level, expected):
+        """Testa que MCP_LOG_LEVEL descarta apenas as linhas abaixo do nível."""
+        monkeypatch.setattr(config, 'LOG_LEVEL', config.LOG_LEVELS[level])
+        messages = ["Info message", "⚠️  Warning message", "❌ Error message", "  CRITICAL indented"]
+        for message in messages:
+            server.log(message)
+        flush_log()
+        captured = capsys.readouterr().err
+        for message in messages:
+            assert (f"[MCP-FIREBIRD] {message}" in captured) == (message in expected)
+
     @pytest.mark.unit
     def test_main_function_library_check(self, mock_environment):
         """Testa função main com verificação de bibliotecas."""
@@ -127,6 +127,27 @@ class TestI18nSystem:
         result = i18n.get("section.subsection.key")
         assert result == "Nested Value"
 
+    @pytest.mark.unit
+    def test_get_after_strings_replaced(self):
+        """Testa que chaves já resolvidas acompanham a troca do dicionário."""
+        i18n = server.I18n()
+        i18n.strings = {"section": {"key": "Old Value"}}
+        assert i18n.get("section.key") == "Old Value"
+
+        i18n.strings = {"section": {"key": "New Value"}}
+        assert i18n.get("section.key") == "New Value"
+
+    @pytest.mark.unit
+    def test_available_languages_listed_once(self):
+        """Testa que a lista de idiomas é reaproveitada enquanto o diretório não muda."""
+        i18n = server.I18n()
+        first = i18n.get_available_languages()
+
+        with patch('os.listdir', side_effect=AssertionError("listdir chamado de novo")):
+            assert i18n.get_available_languages() == first
+
+        assert "en_US" in first
+
     @pytest.mark.unit
     def test_get_nonexistent_key(self):
         """Testa obtenção de chave que não existe."""
@@ -136,6 +157,38 @@ class TestI18nSystem:
         result = i18n.get("nonexistent.key")
         assert result == "nonexistent.key"
 
+    @pytest.mark.unit
+    def test_get_path_and_get_many(self):
+        """Testa obtenção por caminhos de chave já separados."""
+        i18n = server.I18n()
+        i18n.strings = {
+            "section": {"key": "Value"},
+            "other": {"key": "Other"}
+        }
+        
+        assert i18n.get_path(("section", "key")) == "Value"
+        assert i18n.get_many([("section", "key"), ("other", "key")]) == ["Value", "Other"]
+        assert i18n.get_path(("missing", "key")) == "missing.key"
+        assert "missing.key" in i18n.missing_keys
+
+    @pytest.mark.unit
+    def test_validate_completeness_memoized(self):
+        """Testa que a validação de completude é reaproveitada enquanto as strings não mudam."""
+        i18n = server.I18n()
+        i18n.fallback_strings = {"a": "A", "b": "B"}
+        i18n.strings = {"a": "A"}
+        
+        with patch.object(i18n, '_compare_dicts', wraps=i18n._compare_dicts) as compare:
+            first = i18n.validate_completeness()
+            second = i18n.validate_completeness()
+            assert compare.call_count == 1
+        
+        assert first == second
+        assert first["missing_keys"] == ["b"]
+        
+        i18n.strings = {"a": "A", "b": "B"}
+        assert i18n.validate_completeness()["status"] == "complete"
+
     @pytest.mark.unit
     def test_get_with_kwargs_formatting(self):
         """Testa formatação com argumentos nomeados."""
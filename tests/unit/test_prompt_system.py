@@ -52,6 +52,67 @@ class TestDefaultPromptManager:
         assert len(enhanced) >= len(content)
         assert content in enhanced
     
+    def test_default_context_is_cached(self):
+        """Test that the expert context is built once for several responses."""
+        class MockFirebirdServer:
+            calls = 0
+            fdb_available = True
+            client_available = True
+            
+            def test_connection(self, stale_ok=False):
+                MockFirebirdServer.calls += 1
+                return {"connected": True, "version": "5.0.1"}
+        
+        manager = DefaultPromptManager(firebird_server=MockFirebirdServer())
+        manager.apply_to_response("first", tool_name='execute_query')
+        manager.apply_to_response("second", tool_name='list_tables')
+        
+        assert MockFirebirdServer.calls == 1
+    
+    def test_failed_context_is_not_cached(self):
+        """Test that a context build error is retried on the next call."""
+        get = self.manager.i18n.get
+        
+        def failing_get(key, *args, **kwargs):
+            raise KeyError(key)
+        
+        self.manager.i18n.get = failing_get
+        assert self.manager.get_default_context() == ""
+        
+        self.manager.i18n.get = get
+        assert 'Firebird' in self.manager.get_default_context()
+    
+    def test_version_not_probed_without_client(self):
+        """Test that the version falls back without a round-trip when fdb/fbclient is missing."""
+        class MockFirebirdServer:
+            fdb_available = True
+            client_available = False
+            
+            def test_connection(self, stale_ok=False):
+                raise AssertionError("should not connect")
+        
+        manager = DefaultPromptManager(firebird_server=MockFirebirdServer())
+        
+        assert manager._get_firebird_version() == "5.0+"
+    
+    def test_fallback_version_is_not_cached(self):
+        """Test that the "5.0+" placeholder is replaced once the server answers."""
+        class MockFirebirdServer:
+            fdb_available = True
+            client_available = True
+            connected = False
+            
+            def test_connection(self, stale_ok=False):
+                return {"connected": self.connected, "version": "5.0.1"}
+        
+        server = MockFirebirdServer()
+        manager = DefaultPromptManager(firebird_server=server)
+        assert manager._get_firebird_version() == "5.0+"
+        
+        server.connected = True
+        assert manager._get_firebird_version() == "5.0.1"
+        assert '5.0.1' in manager.get_default_context()
+    
     def test_apply_to_response_disabled(self):
         """Test response handling when disabled."""
         content = "Query result: SUCCESS"
@@ -183,6 +244,23 @@ class TestPromptGenerator:
         assert any(p["name"] == "products_schema" for p in prompts)
         assert any(p["name"] == "users_schema" for p in prompts)
     
+    def test_table_prompts_reused_until_tables_change(self):
+        """Test that prompts are rebuilt only when get_tables returns a new result."""
+        class MockFirebirdServer:
+            result = {"success": True, "tables": ["customers"]}
+            
+            def get_tables(self):
+                return self.result
+        
+        mock_server = MockFirebirdServer()
+        generator = PromptGenerator(mock_server)
+        
+        first = generator.get_available_table_prompts()
+        assert generator.get_available_table_prompts() is first
+        
+        mock_server.result = {"success": True, "tables": ["customers", "orders"]}
+        assert len(generator.get_available_table_prompts()) == 2
+    
     def test_get_available_table_prompts_no_server(self):
         """Test available prompts without server."""
         generator = PromptGenerator()
@@ -244,7 +322,83 @@ class TestPromptGenerator:
         assert 'CUSTOMER_ID' in prompt
         assert 'CUSTOMERS' in prompt
         assert 'FK_ORDERS_CUSTOMER' in prompt or 'Chaves Estrangeiras' in prompt or 'Foreign Keys' in prompt
+    
+    def test_generate_is_memoized(self):
+        """Test that repeated prompt requests reuse the generated text."""
+        class MockFirebirdServer:
+            calls = 0
+            
+            def get_table_schema(self, table_name):
+                MockFirebirdServer.calls += 1
+                return {
+                    "success": True,
+                    "table_name": table_name,
+                    "columns": [],
+                    "primary_keys": [],
+                    "foreign_keys": [],
+                    "indexes": []
+                }
+        
+        generator = PromptGenerator(MockFirebirdServer())
+        
+        first = generator.generate('orders_schema', {})
+        second = generator.generate('orders_schema', {})
+        
+        assert first == second
+        assert MockFirebirdServer.calls == 1
+        
+        generator.register_firebird_server(MockFirebirdServer())
+        generator.generate('orders_schema', {})
+        assert MockFirebirdServer.calls == 2
 
+    
+    def test_failed_prompt_is_not_memoized(self):
+        """Test that an error prompt is not served again once the schema can be read."""
+        class MockFirebirdServer:
+            fail = True
+            
+            def get_table_schema(self, table_name):
+                if MockFirebirdServer.fail:
+                    return {"success": False, "error": "connection lost"}
+                return {
+                    "success": True,
+                    "columns": [],
+                    "primary_keys": [],
+                    "foreign_keys": [],
+                    "indexes": []
+                }
+        
+        generator = PromptGenerator(MockFirebirdServer())
+        
+        assert "connection lost" in generator.generate('orders_schema', {})
+        MockFirebirdServer.fail = False
+        assert "connection lost" not in generator.generate('orders_schema', {})
+    
+    def test_prompt_regenerated_after_ddl(self):
+        """Test that a metadata_version bump (DDL) invalidates memoized prompts."""
+        class MockFirebirdServer:
+            calls = 0
+            metadata_version = 0
+            
+            def get_table_schema(self, table_name):
+                MockFirebirdServer.calls += 1
+                return {
+                    "success": True,
+                    "columns": [],
+                    "primary_keys": [],
+                    "foreign_keys": [],
+                    "indexes": []
+                }
+        
+        server = MockFirebirdServer()
+        generator = PromptGenerator(server)
+        
+        generator.generate('orders_schema', {})
+        generator.generate('orders_schema', {})
+        server.metadata_version += 1
+        generator.generate('orders_schema', {})
+        
+        assert MockFirebirdServer.calls == 2
 
 if __name__ == '__main__':
     pytest.main([__file__])
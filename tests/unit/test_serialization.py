@@ -0,0 +1,70 @@
+"""Unit tests for the JSON serialization helpers."""
+
+import sys
+import os
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from core import serialization
+
+
+class TestSerialization:
+    """Test cases for dumps/loads."""
+
+    def test_round_trip(self):
+        """Test that a JSON-RPC message survives dumps/loads."""
+        message = {"jsonrpc": "2.0", "id": 1, "result": {"rows": [[1, "Ana"]]}}
+
+        assert serialization.loads(serialization.dumps(message)) == message
+        assert serialization.loads(serialization.dumps_bytes(message)) == message
+
+    def test_unknown_values_use_str(self):
+        """Test that values without a JSON type are emitted via str()."""
+        assert serialization.loads(serialization.dumps({"total": Decimal("1.50")})) == {"total": "1.50"}
+
+    def test_binary_values_use_base64(self):
+        """Test that bytes (e.g. binary BLOBs) are emitted as base64."""
+        assert serialization.loads(serialization.dumps({"blob": b"\xff\x00"})) == {"blob": "/wA="}
+
+    def test_pretty_output_is_indented(self):
+        """Test that pretty=True indents while the default stays compact."""
+        assert serialization.dumps({"a": [1]}) == '{"a":[1]}'
+        assert serialization.dumps({"a": [1]}, pretty=True) == '{\n  "a": [\n    1\n  ]\n}'
+
+    def test_non_string_keys(self):
+        """Test that integer dict keys are accepted like the standard library."""
+        assert serialization.loads(serialization.dumps({1: "a"})) == {"1": "a"}
+
+    def test_invalid_json_raises_decode_error(self):
+        """Test that malformed input raises the exported JSONDecodeError."""
+        with pytest.raises(serialization.JSONDecodeError):
+            serialization.loads(b'{"jsonrpc": ')
+
+    @pytest.mark.parametrize("value,expected", [
+        (datetime(2024, 1, 1, 12, 0, 0), "2024-01-01 12:00:00"),
+        (date(2024, 1, 1), "2024-01-01"),
+        (time(12, 30), "12:30:00"),
+        (Decimal("1.50"), "1.50"),
+        (float("nan"), None),
+        ([float("inf"), 1.5], [None, 1.5]),
+        (2 ** 70, 2 ** 70),
+    ])
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_backends_agree(self, monkeypatch, value, expected, pretty):
+        """Test that orjson and the stdlib fallback emit identical JSON."""
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        message = {"value": value}
+
+        fast = serialization.dumps(message, pretty=pretty)
+        fast_bytes = serialization.dumps_bytes(message)
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert serialization.dumps(message, pretty=pretty) == fast
+        assert serialization.dumps_bytes(message) == fast_bytes
+        assert serialization.loads(fast) == {"value": expected}
@@ -93,6 +93,19 @@ class TestSQLPatternAnalyzer:
         assert result['complexity'] == 'dangerous'
         assert any('Destructive operation' in suggestion for suggestion in result['suggestions'])
     
+    def test_ddl_with_leading_comment(self):
+        """Test DDL sub-classification when the statement starts with a comment."""
+        sql = """
+        /* cleanup */
+        -- legacy table
+        DROP TABLE old_data
+        """
+        result = self.analyzer.analyze(sql)
+        
+        assert result['type'] == 'drop'
+        assert result['category'] == 'ddl'
+        assert result['complexity'] == 'dangerous'
+    
     def test_firebird_features_detection(self):
         """Test detection of Firebird-specific features."""
         sql = "SELECT id, name FROM customers WHERE FIRST 10 SKIP 20"
@@ -127,6 +140,28 @@ class TestSQLPatternAnalyzer:
         assert result['type'] == 'unknown'
         assert isinstance(result['suggestions'], list)
     
+    def test_analyze_batch_matches_analyze(self):
+        """Test that batch analysis returns the same results as single analysis."""
+        queries = [
+            "SELECT u.name, COUNT(o.id) FROM users u JOIN orders o ON u.id = o.user_id GROUP BY u.name",
+            "INSERT INTO users (name) VALUES ('a'), ('b')",
+            "UPDATE t SET a = CASE WHEN b = 1 THEN 1 END WHERE id = 1 RETURNING a",
+            "DELETE FROM temp_data",
+            "CREATE INDEX idx_users_name ON users (name)"
+        ]
+        
+        results = self.analyzer.analyze_batch(queries)
+        
+        assert results == [self.analyzer.analyze(sql) for sql in queries]
+        assert [r['type'] for r in results] == ['select', 'insert', 'update', 'delete', 'create']
+    
+    def test_patterns_compiled_once(self):
+        """Test that the consolidated feature pattern is shared by all instances."""
+        other = SQLPatternAnalyzer()
+        
+        assert other.PATTERNS is self.analyzer.PATTERNS
+        assert SQLPatternAnalyzer.precompile_patterns() is self.analyzer.PATTERNS
+    
     def test_sql_with_comments(self):
         """Test analysis of SQL with comments."""
         sql = """